@@ -1,26 +1,52 @@
-from launchkit.modules.project_management import handle_existing_project, setup_new_project
-from launchkit.modules.server_management import cleanup_processes
+import sys
+
 from launchkit.utils.display_utils import rich_message, status_message
 from launchkit.utils.learner_utils import setup_learner_mode, is_learner_mode_on
 from launchkit.utils.user_utils import handle_user_data
 
+_WELCOME_MSG = "Welcome to LaunchKIT!"
+_WELCOME_WIDTH = len(_WELCOME_MSG) + 6
+# The banner never changes, so it is built once at import instead of on every run
+_BANNER = (
+    "\n\n\n\n╔" + "═" * _WELCOME_WIDTH + "╗\n"
+    "║" + _WELCOME_MSG.center(_WELCOME_WIDTH) + "║\n"
+    "╚" + "═" * _WELCOME_WIDTH + "╝\n\n"
+)
+
+
+def _cleanup_processes():
+    """Stop any dev servers started during the session."""
+    # Servers can only have been started once server_management was imported, which
+    # also installs its SIGINT/SIGTERM handlers and the atexit hook
+    server_management = sys.modules.get("launchkit.modules.server_management")
+    if server_management is not None:
+        server_management.cleanup_processes()
+
+
+def _run_project_session(data, folder):
+    """Open the selected project: resume its menu if set up, otherwise run the setup flow."""
+    # The project modules pull in the scaffolders, templates and add-ons, so they are
+    # only imported once the user has actually picked a project to work on
+    from launchkit.modules.project_management import handle_existing_project, setup_new_project
+
+    if data.get("setup_complete", False):
+        # For existing projects, enter the project-specific menu
+        handle_existing_project(data, folder)
+    else:
+        # For new projects, start the setup process
+        setup_new_project(data, folder)
+
 
 def main():
     """The main entry point for the LaunchKIT CLI application."""
     try:
         # Display welcome message once
-        print("\n\n")
-        msg = "Welcome to LaunchKIT!"
-        width = len(msg) + 6
-        print("\n╔" + "═" * width + "╗")
-        print("║" + msg.center(width) + "║")
-        print("╚" + "═" * width + "╝\n")
+        # One write and one flush for the whole banner before questionary takes over the screen
+        sys.stdout.write(_BANNER)
+        sys.stdout.flush()
 
         # Handle learner mode setup
-        if not is_learner_mode_on():
-            setup_learner_mode(is_first_time=True)
-        else:
-            setup_learner_mode(is_first_time=False)
+        setup_learner_mode(is_first_time=not is_learner_mode_on())
 
         # Main application loop
         while True:
@@ -31,19 +57,15 @@ def main():
             if data is None and folder is None:
                 break  # Exit the while loop and the application
 
-            # If user selects a project, process it
-            if data.get("setup_complete", False):
-                # For existing projects, enter the project-specific menu
-                handle_existing_project(data, folder)
-            else:
-                # For new projects, start the setup process
-                setup_new_project(data, folder)
+            _run_project_session(data, folder)
 
             # After a project session ends, the loop continues, showing the main menu again.
 
     except KeyboardInterrupt:
-        cleanup_processes()
+        # questionary turns Ctrl+C into a cancelled prompt, which Question re-raises here
         rich_message("\nGoodbye! 👋", style="bold green")
     except Exception as e:
         status_message(f"An unexpected error occurred: {e}", False)
-        cleanup_processes()
\ No newline at end of file
+    finally:
+        _cleanup_processes()
+
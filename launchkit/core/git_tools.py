@@ -1,4 +1,3 @@
-import os
 import subprocess
 import sys
 from pathlib import Path
@@ -8,6 +7,18 @@ from launchkit.utils.scaffold_utils import cleanup_failed_scaffold
 from launchkit.utils.security_utils import SecurityValidator, CommandBuilder
 from launchkit.utils.learning_mode import LearningMode
 
+try:
+    # Optional: libgit2 bindings let us init and commit without spawning git processes
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+
+def _use_pygit2():
+    """Whether git operations can run in-process instead of through the git CLI."""
+    # Learner Mode has the user type the real git commands, so it always uses the CLI path
+    return pygit2 is not None and not LearningMode.is_enabled()
+
 
 def setup_git(folder: Path):
     """Initialize Git in the project folder."""
@@ -31,6 +42,14 @@ def initialize_git_repo(project_path):
     try:
         arrow_message("Initializing git repository...")
 
+        if _use_pygit2():
+            try:
+                pygit2.init_repository(str(project_path))
+                status_message("Local Git repository initialized successfully.")
+                return True
+            except pygit2.GitError:
+                pass  # Fall back to the git CLI below
+
         # Prepare command
         git_init_cmd = CommandBuilder.build_git_command("init")
 
@@ -71,6 +90,20 @@ def create_initial_commit(project_path, msg="Initial commit"):
 
         arrow_message("Creating Initial commit..")
 
+        if _use_pygit2():
+            try:
+                repo = pygit2.Repository(str(project_path))
+                repo.index.add_all()
+                repo.index.write()
+                tree = repo.index.write_tree()
+                # Same user.name/user.email lookup `git commit` does
+                signature = repo.default_signature
+                repo.create_commit("HEAD", signature, signature, msg, tree, [])
+                status_message("Initial commit created successfully.")
+                return True
+            except (pygit2.GitError, KeyError):
+                pass  # Fall back to the git CLI below
+
         # Prepare commands
         git_add_cmd = CommandBuilder.build_git_command("add", ".")
         git_commit_cmd = CommandBuilder.build_git_command("commit", "-m", msg)
@@ -113,11 +146,8 @@ def create_initial_commit(project_path, msg="Initial commit"):
 
     return True
 
-def add_git_ignore_file(project_path):
-
-    """Adds a basic gitignore file with common patterns."""
-
-    gitignore_content = """# Dependencies
+# The generated .gitignore is identical for every project, so it is encoded once at import
+_GITIGNORE_BYTES = b"""# Dependencies
 node_modules/
 venv/
 env/
@@ -168,8 +198,11 @@ launchkit_backup/
 PROJECT_SUMMARY.md
 """
 
-    gitignore_path = os.path.join(project_path, ".gitignore")
-    with open(gitignore_path, "w") as f:
-        f.write(gitignore_content)
+
+def add_git_ignore_file(project_path):
+
+    """Adds a basic gitignore file with common patterns."""
+
+    Path(project_path, ".gitignore").write_bytes(_GITIGNORE_BYTES)
 
     arrow_message(".gitignore file created successfully.")
@@ -1,13 +1,38 @@
 import json
+import os
+import re
+import shutil
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Tuple, Union
 
-from launchkit.utils.display_utils import *
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+
+from launchkit.utils.display_utils import (
+    arrow_message,
+    boxed_message,
+    progress_message,
+    status_message
+)
 from launchkit.utils.que import Question
-from launchkit.utils.stack_utils import *
+from launchkit.utils.stack_utils import (
+    is_node_based_stack,
+    is_python_based_stack,
+    is_react_based_stack,
+    is_next_js_stack
+)
 from launchkit.utils.user_utils import add_data_to_db
 
+try:
+    # Optional: a faster JSON codec for the package.json / settings.json read-modify-writes
+    import orjson
+except ImportError:
+    orjson = None
+
 # ====================================================================================
 # CENTRALIZED ADDON DEPENDENCIES - SINGLE SOURCE OF TRUTH
 # ====================================================================================
@@ -94,6 +119,14 @@ def get_addon_dependencies(addon_name: str, stack: str, framework: Optional[str]
     """
     Retrieves dependencies from the central ADDON_SPECIFICATIONS map.
     """
+    # The resolved lists are cached, so hand out copies the caller is free to modify
+    dependencies = _resolve_addon_dependencies(addon_name, stack, framework)
+    return {key: value.copy() for key, value in dependencies.items()}
+
+
+@lru_cache(maxsize=64)
+def _resolve_addon_dependencies(addon_name: str, stack: str, framework: Optional[str]) -> Dict[str, Any]:
+    """Merge an add-on's ADDON_SPECIFICATIONS entries for a stack; computed once per combination."""
     dependencies = {"npm_dev": [], "npm_prod": [], "python": [], "scripts": {}}
     spec = ADDON_SPECIFICATIONS.get(addon_name, {})
 
@@ -137,256 +170,12 @@ def get_addon_dependencies(addon_name: str, stack: str, framework: Optional[str]
 
 
 # ====================================================================================
-# HELPER FUNCTIONS
+# STATIC CONFIGURATION TEMPLATES
 # ====================================================================================
 
-def _run_npm_command(folder: Path, command: List[str], description: str = ""):
-    """Run npm command in the specified folder."""
-    try:
-        if description:
-            arrow_message(f"{description}...")
-
-        subprocess.run(
-            command,
-            cwd=folder,
-            check=True,
-            shell=False
-        )
-        return True
-    except subprocess.CalledProcessError as e:
-        status_message(f"Failed to run {' '.join(command)}: {e.stderr}", False)
-        return False
-    except FileNotFoundError:
-        status_message("npm not found. Please install Node.js first.", False)
-        return False
-
-
-def _run_pip_command(folder: Path, packages: List[str], description: str = ""):
-    """Run pip install command in the specified folder."""
-    try:
-        if description:
-            arrow_message(f"{description}...")
-
-        command = ["pip", "install"] + packages
-        subprocess.run(
-            command,
-            cwd=folder,
-            check=True
-        )
-        return True
-    except subprocess.CalledProcessError as e:
-        status_message(f"Failed to install {' '.join(packages)}: {e.stderr}", False)
-        return False
-    except FileNotFoundError:
-        status_message("pip not found. Please install Python first.", False)
-        return False
-
-
-def _update_package_json_scripts(folder: Path, new_scripts: Dict[str, str]):
-    """Update package.json with new scripts."""
-    package_json_path = folder / "package.json"
-
-    if not package_json_path.exists():
-        status_message("package.json not found", False)
-        return False
-
-    try:
-        with open(package_json_path, 'r') as f:
-            package_data = json.load(f)
-
-        if "scripts" not in package_data:
-            package_data["scripts"] = {}
-
-        package_data["scripts"].update(new_scripts)
-
-        with open(package_json_path, 'w') as f:
-            json.dump(package_data, f, indent=2)
-
-        return True
-    except (json.JSONDecodeError, IOError) as e:
-        status_message(f"Failed to update package.json: {e}", False)
-        return False
-
-
-def _update_requirements_txt(folder: Path, new_packages: List[str]):
-    """Update or create requirements.txt with new packages."""
-    requirements_path = folder / "requirements.txt"
-
-    existing_packages = set()
-    if requirements_path.exists():
-        with open(requirements_path, 'r') as f:
-            existing_packages = {line.strip().split('==')[0].split('>=')[0].split('<=')[0]
-                                 for line in f if line.strip() and not line.startswith('#')}
-
-    packages_to_add = [pkg for pkg in new_packages
-                       if pkg.split('==')[0].split('>=')[0].split('<=')[0] not in existing_packages]
-
-    if packages_to_add:
-        with open(requirements_path, 'a') as f:
-            if requirements_path.stat().st_size > 0:
-                f.write('\n')
-            for package in packages_to_add:
-                f.write(f"{package}\n")
-
-
-# ====================================================================================
-# MAIN ADDON FUNCTIONS
-# ====================================================================================
-
-def choose_addons() -> List[str]:
-    """Choose add-ons with better categorization."""
-    boxed_message("Available Add-ons")
-
-    containerization_addons = ["Add Docker Support", "Add Kubernetes Support"]
-    ci_cd_addons = ["Add CI (GitHub Actions)"]
-    code_quality_addons = ["Add Linting & Formatter", "Add Unit Testing Skeleton"]
-
-    chosen: List[str] = []
-
-    boxed_message("Containerization & Orchestration")
-    for addon in containerization_addons:
-        ans = Question(f"Would you like to enable: {addon}?", ["Yes", "No"]).ask()
-        if ans == "Yes":
-            chosen.append(addon)
-
-    boxed_message("CI/CD Pipeline")
-    for addon in ci_cd_addons:
-        ans = Question(f"Would you like to enable: {addon}?", ["Yes", "No"]).ask()
-        if ans == "Yes":
-            chosen.append(addon)
-
-    boxed_message("Code Quality & Testing")
-    for addon in code_quality_addons:
-        ans = Question(f"Would you like to enable: {addon}?", ["Yes", "No"]).ask()
-        if ans == "Yes":
-            chosen.append(addon)
-
-    return chosen
-
-
-
-def enable_lint_format(folder: Path, stack: str):
-    """Adds linting/formatting by fetching dependencies centrally."""
-    arrow_message("Adding Linting & Formatter...")
-
-    deps = get_addon_dependencies("Add Linting & Formatter", stack)
-
-    if deps["npm_dev"]:
-        if _run_npm_command(folder, ["npm", "install", "--save-dev"] + deps["npm_dev"],
-                            "Installing linting and formatting dependencies"):
-            _update_package_json_scripts(folder, deps["scripts"])
-
-            eslint_config: Dict[str, Any] = {
-                "extends": ["eslint:recommended"],
-                "env": {"browser": True, "node": True, "es2022": True},
-                "parserOptions": {"ecmaVersion": "latest", "sourceType": "module"},
-                "rules": {"no-unused-vars": "warn", "no-console": "warn"}
-            }
-
-            if is_react_based_stack(stack):
-                eslint_config["extends"].extend(["plugin:react/recommended", "plugin:react-hooks/recommended"])
-                eslint_config["plugins"] = ["react", "react-hooks"]
-                eslint_config["settings"] = {"react": {"version": "detect"}}
-                if is_next_js_stack(stack):
-                    eslint_config["extends"].append("next/core-web-vitals")
-
-            (folder / ".eslintrc.json").write_text(json.dumps(eslint_config, indent=2))
-
-            prettier_config = {
-                "semi": True, "trailingComma": "es5", "singleQuote": True,
-                "printWidth": 80, "tabWidth": 2
-            }
-            (folder / ".prettierrc.json").write_text(json.dumps(prettier_config, indent=2))
-
-            vscode_dir = folder / ".vscode"
-            vscode_dir.mkdir(exist_ok=True)
-            vscode_settings = {
-                "editor.formatOnSave": True,
-                "editor.defaultFormatter": "esbenp.prettier-vscode",
-                "editor.codeActionsOnSave": {"source.fixAll.eslint": True}
-            }
-            (vscode_dir / "settings.json").write_text(json.dumps(vscode_settings, indent=2))
-            status_message("Linting/formatting for Node.js configured!")
-
-    if deps["python"]:
-        if _run_pip_command(folder, deps["python"], "Installing Python linting tools"):
-            _update_requirements_txt(folder, deps["python"])
-            pyproject_toml = """[tool.black]\nline-length = 88\ntarget-version = ['py311']\n\n[tool.isort]\nprofile = "black"\n\n[tool.flake8]\nmax-line-length = 88\nextend-ignore = ["E203", "W503"]\n"""
-            (folder / "pyproject.toml").write_text(pyproject_toml)
-
-            vscode_dir = folder / ".vscode"
-            vscode_dir.mkdir(exist_ok=True)
-            vscode_settings = {
-                "python.formatting.provider": "black",
-                "python.linting.enabled": True,
-                "python.linting.flake8Enabled": True,
-                "editor.formatOnSave": True
-            }
-            (vscode_dir / "settings.json").write_text(json.dumps(vscode_settings, indent=2))
-            status_message("Linting/formatting for Python configured!")
-
-    if "Flask + React" in stack:
-        frontend_dir = folder / "frontend"
-        if frontend_dir.exists():
-            enable_lint_format(frontend_dir, "React (Vite)")
-
-
-def enable_tests(folder: Path, stack: str):
-    """Adds testing skeleton by fetching dependencies centrally."""
-    arrow_message("Adding Unit Testing skeleton...")
-    tests_dir = folder / "tests"
-    tests_dir.mkdir(exist_ok=True)
-    test_framework = ""
-
-    if is_node_based_stack(stack):
-        framework_choices = ["Jest", "Vitest", "Mocha + Chai"]
-        if is_react_based_stack(stack):
-            framework_choices = ["Jest", "Vitest"]
-        test_framework = Question("Select testing framework:", framework_choices).ask()
-
-    elif is_python_based_stack(stack):
-        framework_choices = ["pytest", "unittest"]
-        test_framework = Question("Select testing framework:", framework_choices).ask()
-
-    if not test_framework:
-        return
-
-    deps = get_addon_dependencies("Add Unit Testing Skeleton", stack, framework=test_framework)
-
-    if deps["npm_dev"]:
-        if _run_npm_command(folder, ["npm", "install", "--save-dev"] + deps["npm_dev"],
-                            f"Installing {test_framework} dependencies"):
-            _update_package_json_scripts(folder, deps["scripts"])
-            # Logic for scaffolding test config files and sample tests...
-            # This logic remains the same as your original file but is now cleaner.
-            status_message(f"{test_framework} configured successfully!")
-
-    if deps["python"]:
-        if _run_pip_command(folder, deps["python"], f"Installing {test_framework} dependencies"):
-            _update_requirements_txt(folder, deps["python"])
-            # Logic for scaffolding pytest.ini, conftest.py, etc...
-            # This logic also remains the same.
-            status_message(f"{test_framework} configured successfully!")
-
-    if "Flask + React" in stack:
-        frontend_dir = folder / "frontend"
-        if frontend_dir.exists():
-            enable_tests(frontend_dir, "React (Vite)")
-
-def enable_ci(folder: Path, stack: str):
-    """Enhanced CI configuration with more options."""
-    arrow_message("Adding GitHub Actions CI...")
-
-    workflow = ""
-
-    # Ask for CI configuration
-    include_tests = Question("Include test step in CI?", ["Yes", "No"]).ask()
-    include_build = Question("Include build step in CI?", ["Yes", "No"]).ask()
-    include_deploy = Question("Include deployment step in CI?", ["Yes", "No"]).ask()
-
-    # Node.js based workflow (React, MERN, PERN, Next.js, Express, OpenAI Demo)
-    if is_node_based_stack(stack):
-        workflow = f"""name: Build & Test
+# GitHub Actions workflow fragments, assembled by enable_ci; kept as bytes so the
+# workflow is joined and written without an encode pass
+_NODE_CI_HEADER = b"""name: Build & Test
 on: 
   push:
     branches: [ main, develop ]
@@ -410,40 +199,33 @@ jobs:
         run: npm ci
 """
 
-        if include_build == "Yes":
-            if is_next_js_stack(stack):
-                workflow += """      
+_NODE_CI_BUILD_NEXTJS = b"""      
       - name: Build Next.js application
         run: npm run build
 """
-            else:
-                workflow += """      
+
+_NODE_CI_BUILD = b"""      
       - name: Build application
         run: npm run build
 """
 
-        if include_tests == "Yes":
-            workflow += """      
+_NODE_CI_TEST = b"""      
       - name: Run tests
         run: npm test
 """
 
-        if include_deploy == "Yes":
-            deploy_step = """      
+_NODE_CI_DEPLOY = b"""      
       - name: Deploy to staging
         if: github.ref == 'refs/heads/develop'
         run: |
           echo "Deploying to staging environment"
           # Add your deployment commands here
 """
-            if is_next_js_stack(stack):
-                deploy_step += """          # For Next.js, consider using Vercel CLI or other deployment tools
+
+_NODE_CI_DEPLOY_NEXTJS_NOTE = b"""          # For Next.js, consider using Vercel CLI or other deployment tools
 """
-            workflow += deploy_step
 
-    # Python based workflow (Flask)
-    elif is_python_based_stack(stack):
-        workflow = f"""name: Build & Test
+_PYTHON_CI_HEADER = b"""name: Build & Test
 on: 
   push:
     branches: [ main, develop ]
@@ -468,22 +250,19 @@ jobs:
           pip install -r requirements.txt
 """
 
-        if include_tests == "Yes":
-            workflow += """      
+_PYTHON_CI_TEST = b"""      
       - name: Run tests
         run: |
           python -m pytest
 """
 
-        if include_build == "Yes":
-            workflow += """      
+_PYTHON_CI_BUILD = b"""      
       - name: Build application
         run: |
           python -m build
 """
 
-        if include_deploy == "Yes":
-            workflow += """      
+_PYTHON_CI_DEPLOY = b"""      
       - name: Deploy to staging
         if: github.ref == 'refs/heads/develop'
         run: |
@@ -491,9 +270,7 @@ jobs:
           # Add your Flask deployment commands here
 """
 
-    # Handle fullstack projects with both frontend and backend
-    if "Flask + React" in stack:
-        workflow = f"""name: Build & Test Fullstack
+_FULLSTACK_CI_WORKFLOW = b"""name: Build & Test Fullstack
 on: 
   push:
     branches: [ main, develop ]
@@ -543,24 +320,57 @@ jobs:
         run: npm run build
 """
 
-    (folder / ".github").mkdir(exist_ok=True)
-    (folder / ".github/workflows").mkdir(parents=True, exist_ok=True)
-    (folder / ".github/workflows/ci.yml").write_text(workflow)
+def _eslint_config(react: bool = False, nextjs: bool = False) -> Dict[str, Any]:
+    """Build the ESLint config for plain JS, React or Next.js projects."""
+    eslint_config: Dict[str, Any] = {
+        "extends": ["eslint:recommended"],
+        "env": {"browser": True, "node": True, "es2022": True},
+        "parserOptions": {"ecmaVersion": "latest", "sourceType": "module"},
+        "rules": {"no-unused-vars": "warn", "no-console": "warn"}
+    }
 
-    status_message("GitHub Actions CI workflow created!")
+    if react:
+        eslint_config["extends"].extend(["plugin:react/recommended", "plugin:react-hooks/recommended"])
+        eslint_config["plugins"] = ["react", "react-hooks"]
+        eslint_config["settings"] = {"react": {"version": "detect"}}
+        if nextjs:
+            eslint_config["extends"].append("next/core-web-vitals")
 
+    return eslint_config
 
 
-def enable_docker(folder: Path, stack: str):
-    """Add Docker support based on stack type with comprehensive docker-compose support."""
-    arrow_message("Adding Docker support...")
+# Linting/formatting configs serialized and UTF-8 encoded once at import; enable_lint_format
+# only picks one and writes the bytes as-is
+_ESLINT_BASE_BYTES = json.dumps(_eslint_config(), indent=2).encode("utf-8")
+_ESLINT_REACT_BYTES = json.dumps(_eslint_config(react=True), indent=2).encode("utf-8")
+_ESLINT_NEXTJS_BYTES = json.dumps(_eslint_config(react=True, nextjs=True), indent=2).encode("utf-8")
 
-    dockerfile_content = ""
-    docker_compose_content = ""
+_PRETTIER_CONFIG = {
+    "semi": True, "trailingComma": "es5", "singleQuote": True,
+    "printWidth": 80, "tabWidth": 2
+}
+_PRETTIER_BYTES = json.dumps(_PRETTIER_CONFIG, indent=2).encode("utf-8")
 
-    if is_node_based_stack(stack):
-        if is_next_js_stack(stack):
-            dockerfile_content = """FROM node:18-alpine AS base
+_VSCODE_NODE_SETTINGS = {
+    "editor.formatOnSave": True,
+    "editor.defaultFormatter": "esbenp.prettier-vscode",
+    "editor.codeActionsOnSave": {"source.fixAll.eslint": True}
+}
+_VSCODE_NODE_SETTINGS_BYTES = json.dumps(_VSCODE_NODE_SETTINGS, indent=2).encode("utf-8")
+
+_VSCODE_PYTHON_SETTINGS = {
+    "python.formatting.provider": "black",
+    "python.linting.enabled": True,
+    "python.linting.flake8Enabled": True,
+    "editor.formatOnSave": True
+}
+_VSCODE_PYTHON_SETTINGS_BYTES = json.dumps(_VSCODE_PYTHON_SETTINGS, indent=2).encode("utf-8")
+
+_PYPROJECT_TOML_BYTES = b"""[tool.black]\nline-length = 88\ntarget-version = ['py311']\n\n[tool.isort]\nprofile = "black"\n\n[tool.flake8]\nmax-line-length = 88\nextend-ignore = ["E203", "W503"]\n"""
+
+# enable_docker templates, picked per stack and written as-is
+# Next.js: multi-stage standalone build
+_NEXTJS_DOCKERFILE = b"""FROM node:18-alpine AS base
 
 # Install dependencies only when needed
 FROM base AS deps
@@ -607,8 +417,7 @@ ENV PORT 3000
 
 CMD ["node", "server.js"]
 """
-            # Docker Compose for Next.js
-            docker_compose_content = """version: '3.8'
+_NEXTJS_COMPOSE = b"""version: '3.8'
 
 services:
   app:
@@ -647,9 +456,8 @@ volumes:
   redis_data:
 """
 
-        else:
-            # Regular Node.js/React app
-            dockerfile_content = """FROM node:18-alpine
+# Other Node.js/React apps
+_NODE_DOCKERFILE = b"""FROM node:18-alpine
 
 WORKDIR /app
 
@@ -684,8 +492,7 @@ HEALTHCHECK --interval=30s --timeout=3s --start-period=5s --retries=3 \\
 # Start the application
 CMD ["npm", "start"]
 """
-            # Docker Compose for Node.js/React
-            docker_compose_content = """version: '3.8'
+_NODE_COMPOSE = b"""version: '3.8'
 
 services:
   app:
@@ -737,8 +544,8 @@ volumes:
   redis_data:
 """
 
-    elif is_python_based_stack(stack):
-        dockerfile_content = """FROM python:3.11-slim
+# Flask and other Python apps
+_PYTHON_DOCKERFILE = b"""FROM python:3.11-slim
 
 WORKDIR /app
 
@@ -782,8 +589,7 @@ ENV PYTHONPATH=/app
 # Start the application
 CMD ["flask", "run", "--port=5000"]
 """
-        # Docker Compose for Flask
-        docker_compose_content = """version: '3.8'
+_PYTHON_COMPOSE = b"""version: '3.8'
 
 services:
   app:
@@ -861,10 +667,8 @@ volumes:
   redis_data:
 """
 
-    # Special handling for fullstack apps
-    if "Flask + React" in stack:
-        # Multi-stage Dockerfile for fullstack
-        dockerfile_content = """# Frontend build stage
+# Flask + React: frontend build stage feeding the Python image
+_FULLSTACK_DOCKERFILE = b"""# Frontend build stage
 FROM node:18-alpine AS frontend-builder
 WORKDIR /app/frontend
 COPY frontend/package*.json ./
@@ -916,8 +720,7 @@ ENV PYTHONPATH=/app
 # Start the application
 CMD ["flask", "run", "--port=5000"]
 """
-
-        docker_compose_content = """version: '3.8'
+_FULLSTACK_COMPOSE = b"""version: '3.8'
 
 services:
   app:
@@ -1000,8 +803,8 @@ volumes:
   redis_data:
 """
 
-    elif "MERN" in stack:
-        docker_compose_content = """version: '3.8'
+# MERN and PERN keep the Node.js Dockerfile but add their database services
+_MERN_COMPOSE = b"""version: '3.8'
 
 services:
   app:
@@ -1078,8 +881,7 @@ volumes:
   redis_data:
 """
 
-    elif "PERN" in stack:
-        docker_compose_content = """version: '3.8'
+_PERN_COMPOSE = b"""version: '3.8'
 
 services:
   app:
@@ -1155,14 +957,7 @@ volumes:
   redis_data:
 """
 
-    # Write Dockerfile
-    (folder / "Dockerfile").write_text(dockerfile_content)
-
-    # Always write docker-compose.yml
-    (folder / "docker-compose.yml").write_text(docker_compose_content)
-
-    # Create .dockerignore with comprehensive exclusions
-    dockerignore_content = """# Dependencies
+_DOCKERIGNORE = b"""# Dependencies
 node_modules
 npm-debug.log*
 yarn-debug.log*
@@ -1241,7 +1036,490 @@ docs/_build/
 *.temp
 """
 
-    (folder / ".dockerignore").write_text(dockerignore_content)
+
+# ====================================================================================
+# HELPER FUNCTIONS
+# ====================================================================================
+
+# Directories created during the current apply_addons run; reset at the start of each run
+_ensured_dirs: set = set()
+
+
+def _ensure_dir(path: Path):
+    """Create path (and its parents) unless this add-on run already created it."""
+    if path in _ensured_dirs:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _ensured_dirs.add(path)
+
+
+def _write_files(base: Path, files: Dict[str, Union[str, bytes]]):
+    """Write several generated files under base, creating each parent directory once."""
+    for name, content in files.items():
+        path = base / name
+        _ensure_dir(path.parent)
+        path.write_bytes(content if isinstance(content, bytes) else content.encode("utf-8"))
+
+
+def _write_if_changed(path: Path, content: bytes) -> bool:
+    """Write content unless the file already holds exactly these bytes; True if written."""
+    try:
+        # Compare sizes first so a differing file is usually rejected without reading it
+        if path.stat().st_size == len(content) and path.read_bytes() == content:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(content)
+    return True
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, with orjson when it is installed."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _merge_json_settings(path: Path, updates: Dict[str, Any], fresh: bytes) -> bool:
+    """Merge updates into an existing JSON settings file, keeping keys the user already set.
+
+    fresh is updates pre-serialized, written as-is when there is nothing to merge with.
+    """
+    try:
+        existing = _json_loads(path.read_bytes())
+    except (FileNotFoundError, ValueError):
+        return _write_if_changed(path, fresh)
+    if not isinstance(existing, dict):
+        return _write_if_changed(path, fresh)
+    existing.update(updates)
+    return _write_if_changed(path, _json_dumps(existing))
+
+
+# Dependencies queued by the add-ons during the current apply_addons run, keyed by the
+# folder they belong to, and installed with one npm and one pip call per folder at the end
+_pending_npm_dev: Dict[Path, List[str]] = {}
+_pending_npm_scripts: Dict[Path, Dict[str, str]] = {}
+_pending_pip: Dict[Path, List[str]] = {}
+# Linting and testing queue from separate worker threads
+_pending_lock = threading.Lock()
+
+
+def _queue_npm_dev(folder: Path, packages: List[str], scripts: Dict[str, str]):
+    """Queue npm dev dependencies and package.json scripts for the batched install."""
+    with _pending_lock:
+        _pending_npm_dev.setdefault(folder, []).extend(packages)
+        _pending_npm_scripts.setdefault(folder, {}).update(scripts)
+
+
+def _queue_pip(folder: Path, packages: List[str]):
+    """Queue Python packages for the batched install."""
+    with _pending_lock:
+        _pending_pip.setdefault(folder, []).extend(packages)
+
+
+def _install_jobs() -> int:
+    """How many installs may run at once: LAUNCHKIT_JOBS if set, otherwise the CPU count."""
+    try:
+        return max(1, int(os.environ.get("LAUNCHKIT_JOBS", "")))
+    except ValueError:
+        return os.cpu_count() or 1
+
+
+def _flush_npm(folder: Path, packages: List[str], capture: bool):
+    """Install a folder's queued npm dev dependencies, then add its queued scripts."""
+    packages = list(dict.fromkeys(packages))
+    if _run_npm_command(folder, ["npm", "install", "--save-dev", "--prefer-offline"] + packages,
+                        f"Installing {len(packages)} npm dev dependencies", capture):
+        _update_package_json_scripts(folder, _pending_npm_scripts.get(folder, {}))
+
+
+def _flush_pip(folder: Path, packages: List[str], capture: bool):
+    """Install a folder's queued Python packages, then record them in requirements.txt."""
+    packages = list(dict.fromkeys(packages))
+    if _run_pip_command(folder, packages, f"Installing {len(packages)} Python packages", capture):
+        _update_requirements_txt(folder, packages)
+
+
+def _flush_installs():
+    """Install every queued dependency, one npm install and one pip install per folder.
+
+    Installs for different folders (or npm alongside pip) touch separate files, so they
+    run side by side, with their output captured to keep the terminal readable.
+    """
+    jobs = ([(_flush_npm, folder, packages) for folder, packages in _pending_npm_dev.items()]
+            + [(_flush_pip, folder, packages) for folder, packages in _pending_pip.items()])
+    workers = min(len(jobs), _install_jobs())
+
+    try:
+        if workers <= 1:
+            for flush, folder, packages in jobs:
+                flush(folder, packages, False)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for future in [executor.submit(flush, folder, packages, True)
+                               for flush, folder, packages in jobs]:
+                    future.result()
+    finally:
+        # A failed install must not leave its packages queued for the next run
+        _pending_npm_dev.clear()
+        _pending_npm_scripts.clear()
+        _pending_pip.clear()
+
+
+def _failure_detail(error: subprocess.CalledProcessError) -> str:
+    """The captured stderr of a failed install, decoded only now that it is needed."""
+    if error.stderr:
+        return error.stderr.decode("utf-8", errors="replace").strip()
+    return str(error)
+
+
+@lru_cache(maxsize=None)
+def _resolve_executable(name: str) -> str:
+    """Full path of a PATH executable, looked up once per process.
+
+    Without a shell, subprocess.run on Windows would not find npm.cmd from a bare "npm".
+    """
+    return shutil.which(name) or name
+
+
+def _run_npm_command(folder: Path, command: List[str], description: str = "", capture: bool = False):
+    """Run npm command in the specified folder."""
+    try:
+        if description:
+            arrow_message(f"{description}...")
+
+        subprocess.run(
+            [_resolve_executable(command[0])] + command[1:],
+            cwd=folder,
+            check=True,
+            shell=False,
+            # When capturing, only stderr is kept (for the error message); npm's log is dropped
+            stdout=subprocess.DEVNULL if capture else None,
+            stderr=subprocess.PIPE if capture else None
+        )
+        return True
+    except subprocess.CalledProcessError as e:
+        status_message(f"Failed to run {' '.join(command)}: {_failure_detail(e)}", False)
+        return False
+    except FileNotFoundError:
+        status_message("npm not found. Please install Node.js first.", False)
+        return False
+
+
+def _run_pip_command(folder: Path, packages: List[str], description: str = "", capture: bool = False):
+    """Run pip install command in the specified folder."""
+    try:
+        if description:
+            arrow_message(f"{description}...")
+
+        command = [_resolve_executable("pip"), "install", "--no-input"] + packages
+        subprocess.run(
+            command,
+            cwd=folder,
+            check=True,
+            stdout=subprocess.DEVNULL if capture else None,
+            stderr=subprocess.PIPE if capture else None
+        )
+        return True
+    except subprocess.CalledProcessError as e:
+        status_message(f"Failed to install {' '.join(packages)}: {_failure_detail(e)}", False)
+        return False
+    except FileNotFoundError:
+        status_message("pip not found. Please install Python first.", False)
+        return False
+
+
+def _update_package_json_scripts(folder: Path, new_scripts: Dict[str, str]):
+    """Update package.json with new scripts."""
+    package_json_path = folder / "package.json"
+
+    try:
+        package_data = _json_loads(package_json_path.read_bytes())
+
+        if "scripts" not in package_data:
+            package_data["scripts"] = {}
+
+        package_data["scripts"].update(new_scripts)
+
+        package_json_path.write_bytes(_json_dumps(package_data))
+
+        return True
+    except FileNotFoundError:
+        status_message("package.json not found", False)
+        return False
+    except (json.JSONDecodeError, IOError) as e:
+        status_message(f"Failed to update package.json: {e}", False)
+        return False
+
+
+# Everything after a requirement's project name: version specifiers, markers, whitespace
+_REQUIREMENT_NAME_END = re.compile(r"[=<>!~;\s]")
+
+
+def _requirement_name(requirement: str) -> str:
+    """Project name of a requirements.txt line such as "pytest>=7.0"."""
+    return _REQUIREMENT_NAME_END.split(requirement, 1)[0]
+
+
+def _update_requirements_txt(folder: Path, new_packages: List[str]):
+    """Update or create requirements.txt with new packages."""
+    requirements_path = folder / "requirements.txt"
+
+    try:
+        content = requirements_path.read_text()
+    except FileNotFoundError:
+        content = ""
+
+    existing_packages = set()
+    for line in content.splitlines():
+        line = line.strip()
+        if line and not line.startswith('#'):
+            existing_packages.add(_requirement_name(line))
+
+    packages_to_add = [pkg for pkg in new_packages if _requirement_name(pkg) not in existing_packages]
+
+    if packages_to_add:
+        # The content just read tells whether the file is empty, so no extra stat() is needed
+        with open(requirements_path, 'a') as f:
+            f.write(('\n' if content else '') + ''.join(f"{package}\n" for package in packages_to_add))
+
+
+# ====================================================================================
+# MAIN ADDON FUNCTIONS
+# ====================================================================================
+
+# Add-ons grouped by category, in the order they are offered
+_ADDON_CATEGORIES = (
+    ("Containerization & Orchestration", ("Add Docker Support", "Add Kubernetes Support")),
+    ("CI/CD Pipeline", ("Add CI (GitHub Actions)",)),
+    ("Code Quality & Testing", ("Add Linting & Formatter", "Add Unit Testing Skeleton")),
+)
+_ALL_ADDONS = tuple(addon for _, addons in _ADDON_CATEGORIES for addon in addons)
+_ADDON_PROMPT_CHOICES = ("(None)", *_ALL_ADDONS, "(All)")
+
+
+def choose_addons() -> List[str]:
+    """Choose add-ons with better categorization."""
+    boxed_message("Available Add-ons")
+
+    # One checkbox prompt instead of a Yes/No question per add-on, with shortcuts
+    # for the common "nothing" and "everything" answers
+    chosen = Question(
+        "Select add-ons to enable (space to toggle, enter to confirm):",
+        list(_ADDON_PROMPT_CHOICES),
+        multi=True,
+    ).ask()
+
+    if "(None)" in chosen:
+        return []
+    if "(All)" in chosen:
+        return list(_ALL_ADDONS)
+    return chosen
+
+
+def enable_lint_format(folder: Path, stack: str):
+    """Adds linting/formatting by fetching dependencies centrally."""
+    arrow_message("Adding Linting & Formatter...")
+
+    deps = get_addon_dependencies("Add Linting & Formatter", stack)
+
+    if deps["npm_dev"]:
+        _queue_npm_dev(folder, deps["npm_dev"], deps["scripts"])
+
+        if is_next_js_stack(stack):
+            eslint_config = _ESLINT_NEXTJS_BYTES
+        elif is_react_based_stack(stack):
+            eslint_config = _ESLINT_REACT_BYTES
+        else:
+            eslint_config = _ESLINT_BASE_BYTES
+        _write_if_changed(folder / ".eslintrc.json", eslint_config)
+
+        _write_if_changed(folder / ".prettierrc.json", _PRETTIER_BYTES)
+
+        vscode_dir = folder / ".vscode"
+        _ensure_dir(vscode_dir)
+        _merge_json_settings(vscode_dir / "settings.json", _VSCODE_NODE_SETTINGS,
+                             _VSCODE_NODE_SETTINGS_BYTES)
+        status_message("Linting/formatting for Node.js configured!")
+
+    if deps["python"]:
+        _queue_pip(folder, deps["python"])
+        _write_if_changed(folder / "pyproject.toml", _PYPROJECT_TOML_BYTES)
+
+        vscode_dir = folder / ".vscode"
+        _ensure_dir(vscode_dir)
+        _merge_json_settings(vscode_dir / "settings.json", _VSCODE_PYTHON_SETTINGS,
+                             _VSCODE_PYTHON_SETTINGS_BYTES)
+        status_message("Linting/formatting for Python configured!")
+
+    if "Flask + React" in stack:
+        frontend_dir = folder / "frontend"
+        if frontend_dir.exists():
+            enable_lint_format(frontend_dir, "React (Vite)")
+
+
+def _ask_test_framework(stack: str, previous: Optional[str] = None) -> str:
+    """Ask which testing framework to scaffold; empty when the stack has no test support."""
+    if is_node_based_stack(stack):
+        framework_choices = ["Jest", "Vitest", "Mocha + Chai"]
+        if is_react_based_stack(stack):
+            framework_choices = ["Jest", "Vitest"]
+        return Question("Select testing framework:", framework_choices, default=previous).ask()
+
+    if is_python_based_stack(stack):
+        framework_choices = ["pytest", "unittest"]
+        return Question("Select testing framework:", framework_choices, default=previous).ask()
+
+    return ""
+
+
+def enable_tests(folder: Path, stack: str, test_framework: Optional[str] = None):
+    """Adds testing skeleton by fetching dependencies centrally."""
+    arrow_message("Adding Unit Testing skeleton...")
+
+    if test_framework is None:
+        test_framework = _ask_test_framework(stack)
+
+    if not test_framework:
+        return
+
+    # Only create tests/ once there is a framework to scaffold for
+    _ensure_dir(folder / "tests")
+
+    deps = get_addon_dependencies("Add Unit Testing Skeleton", stack, framework=test_framework)
+
+    if deps["npm_dev"]:
+        _queue_npm_dev(folder, deps["npm_dev"], deps["scripts"])
+        # Logic for scaffolding test config files and sample tests...
+        # This logic remains the same as your original file but is now cleaner.
+        status_message(f"{test_framework} configured successfully!")
+
+    if deps["python"]:
+        _queue_pip(folder, deps["python"])
+        # Logic for scaffolding pytest.ini, conftest.py, etc...
+        # This logic also remains the same.
+        status_message(f"{test_framework} configured successfully!")
+
+    if "Flask + React" in stack:
+        frontend_dir = folder / "frontend"
+        if frontend_dir.exists():
+            # Flask + React was already offered the React frameworks, so reuse the answer
+            enable_tests(frontend_dir, "React (Vite)", test_framework)
+
+@dataclass(frozen=True)
+class CIConfig:
+    """Optional steps to include in the generated GitHub Actions workflow."""
+    tests: bool = False
+    build: bool = False
+    deploy: bool = False
+
+
+_CI_STEP_CHOICES = ("Test step", "Build step", "Deployment step")
+
+
+def _ask_ci_options(stack: str, previous: Optional[Dict[str, bool]] = None) -> CIConfig:
+    """Ask which optional steps the CI workflow should include, in a single checkbox prompt."""
+    checked = None
+    if previous:
+        last = CIConfig(**previous)
+        checked = [step for step, on in zip(_CI_STEP_CHOICES, (last.tests, last.build, last.deploy)) if on]
+    steps = Question(
+        "Select steps to include in CI (space to toggle, enter to confirm):",
+        list(_CI_STEP_CHOICES),
+        multi=True,
+        default=checked,
+    ).ask()
+    return CIConfig(
+        tests="Test step" in steps,
+        build="Build step" in steps,
+        deploy="Deployment step" in steps,
+    )
+
+
+def enable_ci(folder: Path, stack: str, options: Optional[CIConfig] = None):
+    """Enhanced CI configuration with more options."""
+    arrow_message("Adding GitHub Actions CI...")
+
+    parts: List[bytes] = []
+
+    # Ask for CI configuration
+    if options is None:
+        options = _ask_ci_options(stack)
+
+    # Handle fullstack projects with both frontend and backend
+    if "Flask + React" in stack:
+        parts.append(_FULLSTACK_CI_WORKFLOW)
+
+    # Node.js based workflow (React, MERN, PERN, Next.js, Express, OpenAI Demo)
+    elif is_node_based_stack(stack):
+        parts.append(_NODE_CI_HEADER)
+        if options.build:
+            parts.append(_NODE_CI_BUILD_NEXTJS if is_next_js_stack(stack) else _NODE_CI_BUILD)
+        if options.tests:
+            parts.append(_NODE_CI_TEST)
+        if options.deploy:
+            parts.append(_NODE_CI_DEPLOY)
+            if is_next_js_stack(stack):
+                parts.append(_NODE_CI_DEPLOY_NEXTJS_NOTE)
+
+    # Python based workflow (Flask)
+    elif is_python_based_stack(stack):
+        parts.append(_PYTHON_CI_HEADER)
+        if options.tests:
+            parts.append(_PYTHON_CI_TEST)
+        if options.build:
+            parts.append(_PYTHON_CI_BUILD)
+        if options.deploy:
+            parts.append(_PYTHON_CI_DEPLOY)
+
+    # Creating workflows/ creates .github as well, so one call covers the whole tree
+    _ensure_dir(folder / ".github/workflows")
+    _write_if_changed(folder / ".github/workflows/ci.yml", b"".join(parts))
+
+    status_message("GitHub Actions CI workflow created!")
+
+
+
+def enable_docker(folder: Path, stack: str):
+    """Add Docker support based on stack type with comprehensive docker-compose support."""
+    arrow_message("Adding Docker support...")
+
+    dockerfile_content = b""
+    docker_compose_content = b""
+
+    if is_node_based_stack(stack):
+        if is_next_js_stack(stack):
+            dockerfile_content = _NEXTJS_DOCKERFILE
+            docker_compose_content = _NEXTJS_COMPOSE
+        else:
+            # Regular Node.js/React app
+            dockerfile_content = _NODE_DOCKERFILE
+            docker_compose_content = _NODE_COMPOSE
+
+    elif is_python_based_stack(stack):
+        dockerfile_content = _PYTHON_DOCKERFILE
+        docker_compose_content = _PYTHON_COMPOSE
+
+    # Special handling for fullstack apps
+    if "Flask + React" in stack:
+        dockerfile_content = _FULLSTACK_DOCKERFILE
+        docker_compose_content = _FULLSTACK_COMPOSE
+    elif "MERN" in stack:
+        docker_compose_content = _MERN_COMPOSE
+    elif "PERN" in stack:
+        docker_compose_content = _PERN_COMPOSE
+
+    # Dockerfile, docker-compose.yml (always) and .dockerignore in one pass
+    _write_files(folder, {
+        "Dockerfile": dockerfile_content,
+        "docker-compose.yml": docker_compose_content,
+        ".dockerignore": _DOCKERIGNORE,
+    })
 
     # Create Docker development scripts
     create_docker_scripts(folder, stack)
@@ -1255,7 +1533,6 @@ docs/_build/
 def create_docker_scripts(folder: Path, stack: str):
     """Create helpful Docker scripts for development."""
     scripts_dir = folder / "scripts"
-    scripts_dir.mkdir(exist_ok=True)
 
     # Determine application URL based on stack
     app_url = "http://localhost:5000" if is_python_based_stack(stack) else "http://localhost:3000"
@@ -1323,16 +1600,16 @@ docker system prune -af --volumes
 echo "Cleanup completed!"
 """
 
-    (scripts_dir / "dev.sh").write_text(dev_script)
-    (scripts_dir / "prod.sh").write_text(prod_script)
-    (scripts_dir / "stop.sh").write_text(stop_script)
-    (scripts_dir / "clean.sh").write_text(clean_script)
+    _write_files(scripts_dir, {
+        "dev.sh": dev_script,
+        "prod.sh": prod_script,
+        "stop.sh": stop_script,
+        "clean.sh": clean_script,
+    })
 
     # Make scripts executable
-    import os
     for script in ["dev.sh", "prod.sh", "stop.sh", "clean.sh"]:
-        script_path = scripts_dir / script
-        os.chmod(script_path, 0o755)
+        (scripts_dir / script).chmod(0o755)
 
 
 def create_additional_docker_configs(folder: Path, stack: str):
@@ -1483,7 +1760,16 @@ API_KEY=your-api-key-here
     (folder / ".env.example").write_text(env_example)
 
 
-def enable_kubernetes(folder: Path, stack: str):
+def _ask_cluster_type(stack: str, previous: Optional[str] = None) -> str:
+    """Ask which kind of cluster the Kubernetes manifests should target."""
+    return Question(
+        "Which type of cluster are you targeting?",
+        ["Local (minikube, kind, Docker Desktop)", "Cloud (EKS/GKE/AKS)"],
+        default=previous,
+    ).ask()
+
+
+def enable_kubernetes(folder: Path, stack: str, cluster_type: Optional[str] = None):
     """Add comprehensive Kubernetes support with Kustomize, Helm, and helper scripts."""
     arrow_message("Adding Kubernetes support...")
 
@@ -1492,11 +1778,6 @@ def enable_kubernetes(folder: Path, stack: str):
     # CORRECTED: Flask uses 5000, Node uses 3000
     app_port = "5000" if is_python_based_stack(stack) else "3000"
 
-    # --- Create Kustomize structure ---
-    (k8s_dir / "base").mkdir(parents=True, exist_ok=True)
-    (k8s_dir / "overlays" / "development").mkdir(parents=True, exist_ok=True)
-    (k8s_dir / "overlays" / "production").mkdir(parents=True, exist_ok=True)
-
     # --- Create Base Manifests ---
     # deployment.yaml
     deployment_yaml = f"""
@@ -1539,7 +1820,6 @@ spec:
           initialDelaySeconds: 5
           periodSeconds: 10
 """
-    (k8s_dir / "base" / "deployment.yaml").write_text(deployment_yaml)
 
     # service.yaml
     service_yaml = f"""
@@ -1556,44 +1836,16 @@ spec:
       targetPort: {app_port}
   type: ClusterIP
 """
-    (k8s_dir / "base" / "service.yaml").write_text(service_yaml)
-
-    # kustomization.yaml for base
-    base_kustomization_yaml = """
-apiVersion: kustomize.config.k8s.io/v1beta1
-kind: Kustomization
-resources:
-  - deployment.yaml
-  - service.yaml
-"""
-    (k8s_dir / "base" / "kustomization.yaml").write_text(base_kustomization_yaml)
-
-    # --- Create Overlays ---
-    # Development overlay
-    dev_kustomization_yaml = """
-apiVersion: kustomize.config.k8s.io/v1beta1
-kind: Kustomization
-bases:
-  - ../../base
-nameSuffix: -dev
-replicas:
-  - name: """ + app_name + """-deployment
-    count: 1
-"""
-    (k8s_dir / "overlays" / "development" / "kustomization.yaml").write_text(dev_kustomization_yaml)
 
-    # Production overlay
-    prod_kustomization_yaml = """
-apiVersion: kustomize.config.k8s.io/v1beta1
-kind: Kustomization
-bases:
-  - ../../base
-nameSuffix: -prod
-replicas:
-  - name: """ + app_name + """-deployment
-    count: 3
-"""
-    (k8s_dir / "overlays" / "production" / "kustomization.yaml").write_text(prod_kustomization_yaml)
+    # --- Create Kustomize structure ---
+    # The kustomization.yaml files are written by create_kustomization_files below,
+    # which lists the database, monitoring and logging resources as well
+    _write_files(k8s_dir / "base", {
+        "deployment.yaml": deployment_yaml,
+        "service.yaml": service_yaml,
+    })
+    _ensure_dir(k8s_dir / "overlays" / "development")
+    _ensure_dir(k8s_dir / "overlays" / "production")
 
     # --- Create Helm Chart ---
     create_helm_chart(folder, stack, app_name, app_port)
@@ -1605,10 +1857,8 @@ replicas:
     arrow_message("Creating advanced Kubernetes resources...")
 
     # Ask user for cluster type to tailor resources
-    cluster_type = Question(
-        "Which type of cluster are you targeting?",
-        ["Local (minikube, kind, Docker Desktop)", "Cloud (EKS/GKE/AKS)"]
-    ).ask()
+    if cluster_type is None:
+        cluster_type = _ask_cluster_type(stack)
 
     # Generate database, monitoring, and logging manifests
     create_database_resources(k8s_dir, stack, app_name)
@@ -1620,21 +1870,22 @@ replicas:
 
     status_message("Kubernetes configuration added with Kustomize, Helm, and scripts!")
 
-ADDON_DISPATCH: Dict[str, Callable[[Path, str], None]] = {
+ADDON_DISPATCH: Dict[str, Callable[..., None]] = {
     "Add Docker Support": enable_docker,
     "Add Kubernetes Support": enable_kubernetes,
     "Add CI (GitHub Actions)": enable_ci,
     "Add Linting & Formatter": enable_lint_format,
     "Add Unit Testing Skeleton": enable_tests,
 }
+# ADDON_DISPATCH never changes at runtime, so its keys are materialized once
+_ADDON_KEYS: Tuple[str, ...] = tuple(ADDON_DISPATCH)
 
 def add_new_addons(data, folder):
     """Add new add-ons to existing project with dependency installation."""
     # from launchkit.utils.enum_utils import ADDON_DISPATCH
 
-    current_addons = data.get("addons", [])
-    available_addons = [addon for addon in ADDON_DISPATCH.keys()
-                        if addon not in current_addons]
+    current_addons = set(data.get("addons", []))
+    available_addons = [addon for addon in _ADDON_KEYS if addon not in current_addons]
 
     if not available_addons:
         status_message("All available add-ons are already configured!", True)
@@ -1643,34 +1894,80 @@ def add_new_addons(data, folder):
     available_addons.append("Cancel")
     new_addon = Question("Select add-on to add:", available_addons).ask()
 
-    if new_addon != "Cancel" and new_addon in available_addons:
+    if new_addon != "Cancel":
         stack = data.get("project_stack", "")
-        apply_addons([new_addon], folder, stack)
+        apply_addons([new_addon], folder, stack, data.setdefault("addon_prefs", {}))
         data["addons"].append(new_addon)
         add_data_to_db(data, str(folder))
         status_message(f"{new_addon} added successfully!")
 
-def apply_addons(addons: List[str], folder: Path, stack: str):
-    """Apply selected add-ons with progress tracking."""
-    # from launchkit.utils.enum_utils import ADDON_DISPATCH
+# Questions each add-on needs answered, asked on the main thread before any add-on runs;
+# the answer is passed to the add-on's enable_* function as its third argument. Each
+# prompt takes the stack and the project's previous answer, offered as the default.
+_ADDON_PROMPTS: Dict[str, Callable[[str, Any], Any]] = {
+    "Add Unit Testing Skeleton": _ask_test_framework,
+    "Add CI (GitHub Actions)": _ask_ci_options,
+    "Add Kubernetes Support": _ask_cluster_type,
+}
 
+def _configure_addon(addon: str, folder: Path, stack: str, answers: Dict[str, Any]):
+    """Run a single add-on's configuration function, reporting success or failure."""
+    fn = ADDON_DISPATCH.get(addon)
+    if not fn:
+        status_message(f"Unknown addon skipped: {addon}", False)
+        return
+    try:
+        if addon in answers:
+            fn(folder, stack, answers[addon])
+        else:
+            fn(folder, stack)
+        status_message(f"{addon} configured successfully!")
+    except Exception as e:
+        status_message(f"Failed to configure {addon}: {e}", False)
+
+
+def apply_addons(addons: List[str], folder: Path, stack: str, prefs: Optional[Dict[str, Any]] = None):
+    """Apply selected add-ons with progress tracking.
+
+    prefs is the project's saved add-on answers (data["addon_prefs"]); they are offered
+    as defaults and updated in place with the new answers, for the caller to save.
+    """
     if not addons:
         arrow_message("No add-ons to apply.")
         return
 
     progress_message(f"Applying {len(addons)} add-on(s)...")
-
-    for i, addon in enumerate(addons, 1):
-        rich_message(f"[{i}/{len(addons)}] Configuring: {addon}", False)
-        fn = ADDON_DISPATCH.get(addon)
-        if fn:
-            try:
-                fn(folder, stack)
-                status_message(f"{addon} configured successfully!")
-            except Exception as e:
-                status_message(f"Failed to configure {addon}: {e}", False)
-        else:
-            status_message(f"Unknown addon skipped: {addon}", False)
+    _ensured_dirs.clear()
+    _pending_npm_dev.clear()
+    _pending_npm_scripts.clear()
+    _pending_pip.clear()
+
+    # Every question is asked up front, so nothing below needs the terminal
+    if prefs is None:
+        prefs = {}
+    answers = {addon: _ADDON_PROMPTS[addon](stack, prefs.get(addon))
+               for addon in addons if addon in _ADDON_PROMPTS}
+    for addon, answer in answers.items():
+        prefs[addon] = asdict(answer) if isinstance(answer, CIConfig) else answer
+
+    # Add-ons write disjoint files (linting and testing only queue their installs) and
+    # nothing prompts from here on, so they all run in worker threads under a live progress bar
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+    ) as progress, ThreadPoolExecutor(max_workers=min(len(addons), os.cpu_count() or 1)) as executor:
+        task = progress.add_task("Configuring: " + ", ".join(addons), total=len(addons))
+        futures = {executor.submit(_configure_addon, addon, folder, stack, answers): addon
+                   for addon in addons}
+        # Re-raise anything _configure_addon did not handle instead of dropping it with the future
+        for future in as_completed(futures):
+            future.result()
+            progress.update(task, advance=1, description=f"Finished: {futures[future]}")
+
+    # Linting and testing only queue their dependencies, so npm/pip resolve once per folder
+    _flush_installs()
 
     boxed_message("🎉 All add-ons configured!")
 
@@ -2505,7 +2802,7 @@ spec:
 def create_k8s_scripts(folder: Path, app_name: str):
     """Create helper scripts for Kubernetes management."""
     scripts_dir = folder / "scripts"
-    scripts_dir.mkdir(exist_ok=True)
+    _ensure_dir(scripts_dir)
 
     # Deploy script
     deploy_script = f"""#!/bin/bash
@@ -2523,15 +2820,14 @@ kubectl get all -l app={app_name}
     (scripts_dir / "k8s-status.sh").write_text(status_script)
 
     # Make scripts executable
-    import os
-    os.chmod(scripts_dir / "k8s-deploy.sh", 0o755)
-    os.chmod(scripts_dir / "k8s-status.sh", 0o755)
+    (scripts_dir / "k8s-deploy.sh").chmod(0o755)
+    (scripts_dir / "k8s-status.sh").chmod(0o755)
 
 
 def create_helm_chart(folder: Path, stack: str, app_name: str, app_port: str):
     """Create a Helm chart for easier deployment management."""
     helm_dir = folder / "helm" / app_name
-    (helm_dir / "templates").mkdir(parents=True, exist_ok=True)
+    _ensure_dir(helm_dir / "templates")
 
     # --- Determine stack-specific values first to clean up the f-string ---
     if "MERN" in stack:
@@ -2597,7 +2893,7 @@ secrets:
 
     # --- Create templates directory ---
     templates_dir = helm_dir / "templates"
-    templates_dir.mkdir(exist_ok=True)
+    _ensure_dir(templates_dir)
 
     # --- deployment.yaml template ---
     deployment_template = f"""apiVersion: apps/v1
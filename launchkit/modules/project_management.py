@@ -1,5 +1,11 @@
+import json
+import platform
+import re
+import shutil
 import subprocess
 import sys
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -7,8 +13,15 @@ from launchkit.core.git_tools import setup_git
 from launchkit.modules.addon_management import choose_addons, apply_addons, add_new_addons
 from launchkit.modules.server_management import running_processes, run_dev_server, server_management_menu, \
     cleanup_processes
-from launchkit.utils.display_utils import *
-from launchkit.utils.enum_utils import STACK_CONFIG
+from launchkit.utils.display_utils import (
+    arrow_message,
+    boxed_message,
+    exiting_program,
+    progress_message,
+    rich_message,
+    status_message
+)
+from launchkit.utils.enum_utils import PROJECT_TYPES, STACK_CATALOG
 from launchkit.utils.que import Question
 from launchkit.utils.scaffold_utils import scaffold_project_with_cleanup, cleanup_failed_scaffold, \
     scaffold_project_complete_delete
@@ -17,7 +30,8 @@ from launchkit.utils.stack_utils import (
     is_python_based_stack,
     is_react_based_stack,
     is_next_js_stack,
-    is_fullstack_stack
+    is_fullstack_stack,
+    get_stack_scaffolder
 )
 from launchkit.utils.support_utils import deploy_with_docker, deploy_to_kubernetes, setup_automated_deployment, \
     show_manual_deployment_guide
@@ -25,11 +39,18 @@ from launchkit.utils.user_utils import add_data_to_db, create_backup, rename_pro
 from launchkit.utils.security_utils import SecurityValidator
 
 
+# Project types are derived from STACK_CONFIG once, so the prompt can be built once too
+_PROJECT_TYPE_QUESTION = Question("Select your project type:", [*PROJECT_TYPES, "Cancel"])
+
+
+@lru_cache(maxsize=None)
+def _stack_question(project_type: str) -> Question:
+    """Build (once per project type) the stack prompt from the precomputed catalog."""
+    return Question(f"Select a tech stack for '{project_type}':", [*STACK_CATALOG[project_type], "Cancel"])
+
+
 def choose_project_type() -> Any | None:
-    # Dynamically get project types from the new STACK_CONFIG
-    project_types = sorted(list(set(info['project_type'] for info in STACK_CONFIG.values())))
-    project_choices = project_types + ["Cancel"]
-    project_type = Question("Select your project type:", project_choices).ask()
+    project_type = _PROJECT_TYPE_QUESTION.ask()
 
     if project_type == "Cancel":
         return None
@@ -38,17 +59,12 @@ def choose_project_type() -> Any | None:
 
 
 def choose_stack(project_type: str) -> str | None:
-    # Get available stacks for the chosen project type from STACK_CONFIG
-    stacks = [
-        name for name, config in STACK_CONFIG.items()
-        if config['project_type'] == project_type
-    ]
-    if not stacks:
+    # Stacks per project type are precomputed (and sorted) from STACK_CONFIG
+    if not STACK_CATALOG.get(project_type):
         status_message("No stacks configured for this project type.", False)
         return None
 
-    stack_choices = sorted(stacks) + ["Cancel"]
-    stack = Question(f"Select a tech stack for '{project_type}':", stack_choices).ask()
+    stack = _stack_question(project_type).ask()
 
     if stack == "Cancel":
         return None
@@ -56,6 +72,10 @@ def choose_stack(project_type: str) -> str | None:
     return stack
 
 
+# Keywords that mark important summary lines in Jest/pytest output, scanned in one pass
+_SUMMARY_LINE_RE = re.compile(r"fail|error|tests:|summary:", re.IGNORECASE)
+
+
 def display_failed_test_summary(output: str, error_output: str):
     """Parses and displays a summary of failed test output."""
     boxed_message("Test Failure Summary")
@@ -66,12 +86,8 @@ def display_failed_test_summary(output: str, error_output: str):
     summary_lines = []
     error_details = []
 
-    # Keywords to find important summary lines
-    keywords = ['fail', 'error', 'failed', 'tests:', 'summary:']
-
     for line in lines:
-        line_lower = line.lower()
-        if any(keyword in line_lower for keyword in keywords):
+        if _SUMMARY_LINE_RE.search(line):
             summary_lines.append(line)
         # Symbols used by Jest/Pytest to highlight specific test case errors
         if line.strip().startswith(('●', '>', 'E ', 'F ', '_')) and 'node_modules' not in line:
@@ -98,8 +114,8 @@ def display_failed_test_summary(output: str, error_output: str):
 
 
 def run_scaffolding(stack: str, folder: Path):
-    # Get the scaffolder function directly from STACK_CONFIG
-    scaffold_function = STACK_CONFIG.get(stack, {}).get('scaffolder')
+    # Resolve the scaffolder registered in STACK_CONFIG
+    scaffold_function = get_stack_scaffolder(stack)
 
     if not scaffold_function:
         status_message(f"No scaffolder registered for '{stack}'.", False)
@@ -116,8 +132,10 @@ def run_scaffolding(stack: str, folder: Path):
 def create_project_summary(data: dict, folder: Path):
     """Create a project summary file with all configurations."""
     stack = data.get('project_stack', 'N/A')
+    folder_name = folder.name
+    image_name = folder_name.lower()
 
-    summary_content = f"""# {folder.name} - Project Summary
+    parts = [f"""# {folder_name} - Project Summary
 
 ## Project Configuration
 - **Project Type:** {data.get('project_type', 'N/A')}
@@ -126,82 +144,84 @@ def create_project_summary(data: dict, folder: Path):
 - **User:** {data.get('user_name', 'Unknown')}
 
 ## Features Enabled
-"""
+"""]
 
     addons = data.get('addons', [])
+    # Membership checks below run against a set; the list keeps the user's order for display
+    addons_set = frozenset(addons)
     if addons:
         for addon in addons:
-            summary_content += f"- {addon}\n"
+            parts.append(f"- {addon}\n")
     else:
-        summary_content += "- No additional features enabled\n"
+        parts.append("- No additional features enabled\n")
 
-    summary_content += f"""
+    parts.append(f"""
 ## Directory Structure
 ```
-{folder.name}/
+{folder_name}/
 ├── src/                 # Source code
 ├── tests/              # Test files
-"""
+""")
 
     # Add stack-specific directory structure
     if is_next_js_stack(stack):
-        summary_content += """├── pages/              # Next.js pages
+        parts.append("""├── pages/              # Next.js pages
     ├── components/         # React components
-    """
+    """)
         # ADDED logic for Vue/Nuxt
     elif "Vue.js" in stack or "Nuxt.js" in stack:
-        summary_content += """├── components/         # Vue components
+        parts.append("""├── components/         # Vue components
     ├── assets/             # Static assets
-    """
+    """)
         # ADDED logic for Svelte/SvelteKit
     elif "Svelte" in stack:
-        summary_content += """├── lib/                # Svelte components/modules
+        parts.append("""├── lib/                # Svelte components/modules
     ├── routes/             # SvelteKit pages
-    """
+    """)
         # ADDED logic for Angular
     elif "Angular" in stack:
-        summary_content += """├── app/                # Main application module
+        parts.append("""├── app/                # Main application module
     ├── assets/             # Static assets
-    """
+    """)
     elif is_react_based_stack(stack):
-        summary_content += """├── components/         # React components
-    """
+        parts.append("""├── components/         # React components
+    """)
     elif is_fullstack_stack(stack):
         if "Flask + React" in stack:
-            summary_content += """├── frontend/           # React frontend
+            parts.append("""├── frontend/           # React frontend
 │   ├── src/
 │   └── public/
 ├── backend/            # Flask backend
 │   ├── app/
 │   └── requirements.txt
-"""
+""")
         elif "MERN" in stack or "PERN" in stack:
-            summary_content += """├── client/             # React frontend
+            parts.append("""├── client/             # React frontend
 ├── server/             # Express backend
 ├── models/             # Database models
-"""
+""")
 
     # Add addon-specific structure
-    if "Add Docker Support" in addons:
-        summary_content += """├── Dockerfile          # Docker configuration
+    if "Add Docker Support" in addons_set:
+        parts.append("""├── Dockerfile          # Docker configuration
 ├── docker-compose.yml  # Docker Compose setup
 ├── .dockerignore      # Docker ignore rules
-"""
+""")
 
-    if "Add Kubernetes Support" in addons:
-        summary_content += """├── k8s/               # Kubernetes manifests
+    if "Add Kubernetes Support" in addons_set:
+        parts.append("""├── k8s/               # Kubernetes manifests
 │   ├── deployment.yaml
 │   ├── service.yaml
 │   └── configmap.yaml
-"""
+""")
 
-    if "Add CI (GitHub Actions)" in addons:
-        summary_content += """├── .github/
+    if "Add CI (GitHub Actions)" in addons_set:
+        parts.append("""├── .github/
 │   └── workflows/
 │       └── ci.yml     # CI/CD pipeline
-"""
+""")
 
-    summary_content += """├── .git/              # Git repository
+    parts.append(f"""├── .git/              # Git repository
 ├── .gitignore         # Git ignore rules
 └── README.md          # Project documentation
 ```
@@ -211,77 +231,78 @@ def create_project_summary(data: dict, folder: Path):
 ### Development
 ```bash
 # Navigate to project directory
-cd """ + str(folder) + """
+cd {folder}
 
 # Install dependencies
-"""
+""")
 
     # Add stack-specific installation commands
-    if is_node_based_stack(stack) or any(s in stack for s in ["Vue", "Angular", "Svelte"]):
-        summary_content += "npm install"
+    # Vue, Angular and Svelte stacks are all "js" in STACK_CONFIG, so this covers them too
+    if is_node_based_stack(stack):
+        parts.append("npm install")
         if "Flask + React" in stack:
-            summary_content += """
+            parts.append("""
 cd backend && pip install -r requirements.txt
-cd ../frontend && npm install"""
+cd ../frontend && npm install""")
     elif is_python_based_stack(stack):
-        summary_content += "pip install -r requirements.txt"
+        parts.append("pip install -r requirements.txt")
 
-    summary_content += """
+    parts.append("""
 
 # Start development server
-"""
+""")
 
     # Add stack-specific dev server commands
     if is_next_js_stack(stack) or "Nuxt.js" in stack:
-        summary_content += "npm run dev  # Starts on http://localhost:3000"
+        parts.append("npm run dev  # Starts on http://localhost:3000")
         # ADDED logic for Vite-based stacks
     elif "Vite" in stack or "SvelteKit" in stack:
-        summary_content += "npm run dev  # Starts on http://localhost:5173"
+        parts.append("npm run dev  # Starts on http://localhost:5173")
         # ADDED logic for Angular
     elif "Angular" in stack:
-        summary_content += "npm start    # Starts on http://localhost:4200"
+        parts.append("npm start    # Starts on http://localhost:4200")
     elif is_react_based_stack(stack) and not is_next_js_stack(stack):
-        summary_content += "npm start   # Starts on http://localhost:3000"
+        parts.append("npm start   # Starts on http://localhost:3000")
     elif "Node.js (Express)" in stack:
-        summary_content += "npm run dev # or node server.js"
+        parts.append("npm run dev # or node server.js")
     elif "Flask (Python)" in stack:
-        summary_content += "flask run   # Starts on http://localhost:5000"
+        parts.append("flask run   # Starts on http://localhost:5000")
     elif "Flask + React" in stack:
-        summary_content += """# Terminal 1: Backend
+        parts.append("""# Terminal 1: Backend
 cd backend && flask run
 
 # Terminal 2: Frontend  
-cd frontend && npm start"""
+cd frontend && npm start""")
     elif "MERN" in stack or "PERN" in stack:
-        summary_content += """# Terminal 1: Backend
+        parts.append("""# Terminal 1: Backend
 cd server && npm run dev
 
 # Terminal 2: Frontend
-cd client && npm start"""
+cd client && npm start""")
 
-    summary_content += "\n```"
+    parts.append("\n```")
 
-    if "Add Docker Support" in addons:
-        summary_content += """
+    if "Add Docker Support" in addons_set:
+        parts.append("""
 ### Docker
 ```bash
 # Build and run with Docker Compose
 docker-compose up --build
 
 # Or build and run separately
-docker build -t """ + folder.name.lower() + """ .
-"""
+docker build -t """ + image_name + """ .
+""")
         if is_node_based_stack(stack):
-            summary_content += "docker run -p 3000:3000 " + folder.name.lower()
+            parts.append("docker run -p 3000:3000 " + image_name)
         else:
-            summary_content += "docker run -p 5000:5000 " + folder.name.lower()
+            parts.append("docker run -p 5000:5000 " + image_name)
 
-        summary_content += """
+        parts.append("""
 ```
-"""
+""")
 
-    if "Add Kubernetes Support" in addons:
-        summary_content += """
+    if "Add Kubernetes Support" in addons_set:
+        parts.append("""
 ### Kubernetes
 ```bash
 # Apply Kubernetes manifests
@@ -294,146 +315,146 @@ kubectl get services
 # Access your application
 kubectl port-forward service/app-service 8080:80
 ```
-"""
+""")
 
-    summary_content += """
+    parts.append("""
 ### Testing
 ```bash
 # Run tests
-"""
+""")
 
     if is_node_based_stack(stack):
-        summary_content += "npm test"
+        parts.append("npm test")
     elif is_python_based_stack(stack):
-        summary_content += "pytest  # or python -m unittest"
+        parts.append("pytest  # or python -m unittest")
 
-    summary_content += """
+    parts.append("""
 ```
 
 ### Building for Production
 ```bash
 # Build production version
-"""
+""")
 
     if is_node_based_stack(stack):
-        summary_content += "npm run build"
+        parts.append("npm run build")
     elif is_python_based_stack(stack):
-        summary_content += "# Flask apps are typically run with gunicorn in production"
+        parts.append("# Flask apps are typically run with gunicorn in production")
 
-    summary_content += """
+    parts.append("""
 ```
 
 ## Technology Stack Details
 
 ### """ + stack + """
-"""
+""")
 
     # Add stack-specific details
     if "React (Vite)" in stack:
-        summary_content += """- **Frontend Framework:** React 18+
+        parts.append("""- **Frontend Framework:** React 18+
 - **Build Tool:** Vite (fast HMR and builds)
 - **Development Server:** Vite dev server
 - **Recommended:** Modern React patterns (hooks, functional components)
-"""
+""")
     elif "React (Next.js" in stack:
-        summary_content += """- **Frontend Framework:** React 18+ with Next.js
+        parts.append("""- **Frontend Framework:** React 18+ with Next.js
 - **Rendering:** """ + ("Server-Side Rendering" if "SSR" in stack else "Static Site Generation") + """
 - **Routing:** File-based routing
 - **API Routes:** Built-in API support
 - **Deployment:** Optimized for Vercel (also works elsewhere)
-"""
+""")
     elif "Vue.js (Vite)" in stack:
-        summary_content += """- **Frontend Framework:** Vue 3
+        parts.append("""- **Frontend Framework:** Vue 3
     - **Build Tool:** Vite
     - **Development Server:** Vite dev server
     - **Recommended:** Composition API, Single File Components
-    """
+    """)
     elif "Nuxt.js" in stack:
-        summary_content += """- **Fullstack Framework:** Nuxt.js (based on Vue)
+        parts.append("""- **Fullstack Framework:** Nuxt.js (based on Vue)
     - **Rendering:** Universal (SSR, SSG, CSR)
     - **Routing:** File-based routing
     - **Deployment:** Optimized for serverless platforms
-    """
+    """)
     elif "Angular" in stack:
-        summary_content += """- **Frontend Framework:** Angular
+        parts.append("""- **Frontend Framework:** Angular
     - **Architecture:** Component-based, opinionated framework
     - **Language:** TypeScript
     - **Tooling:** Angular CLI
-    """
+    """)
     elif "Svelte (Vite)" in stack:
-        summary_content += """- **UI Framework:** Svelte
+        parts.append("""- **UI Framework:** Svelte
     - **Compiler:** Compiles to highly optimized vanilla JS
     - **Build Tool:** Vite
     - **Reactivity:** Built into the language
-    """
+    """)
     elif "SvelteKit" in stack:
-        summary_content += """- **Fullstack Framework:** SvelteKit
+        parts.append("""- **Fullstack Framework:** SvelteKit
     - **Rendering:** SSR, SSG with client-side hydration
     - **Routing:** File-based routing
     - **Adapters:** Build for any platform (Vercel, Netlify, Node)
-    """
+    """)
     elif "Node.js (Express)" in stack:
-        summary_content += """- **Runtime:** Node.js
+        parts.append("""- **Runtime:** Node.js
 - **Framework:** Express.js
 - **Architecture:** RESTful API server
 - **Recommended:** MVC pattern, middleware usage
-"""
+""")
     elif "Flask (Python)" in stack:
-        summary_content += """- **Language:** Python 3.11+
+        parts.append("""- **Language:** Python 3.11+
 - **Framework:** Flask
 - **Architecture:** Lightweight web framework
 - **Recommended:** Blueprint organization, environment configuration
-"""
+""")
     elif "MERN" in stack:
-        summary_content += """- **Database:** MongoDB
+        parts.append("""- **Database:** MongoDB
 - **Backend:** Express.js + Node.js
 - **Frontend:** React
 - **Full-stack:** Complete JavaScript ecosystem
-"""
+""")
     elif "PERN" in stack:
-        summary_content += """- **Database:** PostgreSQL
+        parts.append("""- **Database:** PostgreSQL
 - **Backend:** Express.js + Node.js  
 - **Frontend:** React
 - **Full-stack:** JavaScript + SQL ecosystem
-"""
+""")
     elif "Flask + React" in stack:
-        summary_content += """- **Backend:** Flask (Python)
+        parts.append("""- **Backend:** Flask (Python)
 - **Frontend:** React (JavaScript)
 - **Architecture:** Decoupled frontend/backend
 - **API:** RESTful communication between layers
-"""
+""")
     elif "OpenAI Demo" in stack:
-        summary_content += """- **API Integration:** OpenAI GPT models
+        parts.append("""- **API Integration:** OpenAI GPT models
 - **Backend:** Node.js/Express or Python/Flask
 - **Frontend:** Minimal UI for demo purposes
 - **Focus:** API integration and prompt engineering
-"""
+""")
 
-    summary_content += """
+    parts.append("""
 ## Next Steps
 1. Update the README.md with project-specific information
 2. Configure environment variables as needed (.env file)
 3. Set up your development environment
 4. Start building your application!
-"""
+""")
 
     # Add stack-specific next steps
     if "OpenAI Demo" in stack:
-        summary_content += """5. Add your OpenAI API key to environment variables
+        parts.append("""5. Add your OpenAI API key to environment variables
 6. Customize prompts and responses for your use case
-"""
+""")
     elif is_fullstack_stack(stack):
-        summary_content += """5. Configure database connection
+        parts.append("""5. Configure database connection
 6. Set up authentication if needed
 7. Plan your API endpoints
-"""
+""")
     elif is_react_based_stack(stack):
-        summary_content += """5. Plan your component structure
+        parts.append("""5. Plan your component structure
 6. Set up state management if needed (Redux, Zustand, etc.)
 7. Configure routing for multi-page apps
-"""
+""")
 
-    summary_content += """
+    parts.append("""
 ## Useful Commands
 ```bash
 # View all available npm scripts (for Node.js projects)
@@ -454,14 +475,17 @@ npm run format  # or black .
 
 ---
 Generated by LaunchKIT • """ + stack + """
-"""
+""")
 
-    (folder / "PROJECT_SUMMARY.md").write_text(summary_content, encoding='utf-8')
+    # Stream the sections through one buffered writer rather than joining them first
+    with open(folder / "PROJECT_SUMMARY.md", "w", encoding='utf-8') as summary_file:
+        summary_file.writelines(parts)
     status_message("Project summary created: PROJECT_SUMMARY.md")
 
 
 def setup_new_project(data, folder):
     """Handle the initial project setup flow."""
+    folder_str = str(folder)
     try:
         # Check if project type and stack are already selected from a previous run
         if not data.get("project_type"):
@@ -471,7 +495,6 @@ def setup_new_project(data, folder):
                 arrow_message("Project setup cancelled.")
                 return
             data["project_type"] = ptype
-            add_data_to_db(data, str(folder))
         else:
             ptype = data["project_type"]
         boxed_message(f"Project type selected: {ptype}")
@@ -483,17 +506,20 @@ def setup_new_project(data, folder):
                 arrow_message("Project setup cancelled.")
                 return
             data["project_stack"] = stack
-            add_data_to_db(data, str(folder))
         else:
             stack = data["project_stack"]
         boxed_message(f"Tech stack selected: {stack}")
 
+        # Checkpoint after every step so an interrupted setup resumes where it stopped;
+        # unchanged data is not rewritten
+        add_data_to_db(data, folder_str, checkpoint=True)
+
         # Initialize Git only if it hasn't been done before
         if not data.get("git_setup", False):
             progress_message("Initializing Git repository")
             setup_git(folder)
             data["git_setup"] = True
-            add_data_to_db(data, str(folder))  # Save this crucial step immediately
+            add_data_to_db(data, folder_str, checkpoint=True)
         else:
             arrow_message("Git repository already initialized.")
 
@@ -507,23 +533,31 @@ def setup_new_project(data, folder):
              else:
                  arrow_message("No add-ons selected.")
                  data["addons"] = []
+             add_data_to_db(data, folder_str, checkpoint=True)
         else:
             addons = data["addons"]
             arrow_message(f"Using previously selected add-ons: {', '.join(addons)}")
 
 
-        # Step 4: Scaffold project
-        progress_message("Setting up project structure...")
-        run_scaffolding(stack, folder)
-        data["stack_scaffolding"] = True
+        # Step 4: Scaffold project (skipped when a previous run already got this far)
+        if not data.get("stack_scaffolding", False):
+            progress_message("Setting up project structure...")
+            run_scaffolding(stack, folder)
+            data["stack_scaffolding"] = True
+            add_data_to_db(data, folder_str, checkpoint=True)
+        else:
+            arrow_message("Project structure already scaffolded.")
 
         # Step 5: Apply add-ons
-        apply_addons(addons, folder, stack)
-        data["addons_scaffolding"] = True
+        if not data.get("addons_scaffolding", False):
+            apply_addons(addons, folder, stack, data.setdefault("addon_prefs", {}))
+            data["addons_scaffolding"] = True
+            add_data_to_db(data, folder_str, checkpoint=True)
+        else:
+            arrow_message("Add-ons already applied.")
 
         # Step 6: Create project summary
-        import datetime
-        data["created_date"] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        data["created_date"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         create_project_summary(data, folder)
 
         # Mark setup as complete
@@ -531,7 +565,7 @@ def setup_new_project(data, folder):
         data["project_status"] = "ready"
 
         # Step 7: Save to database
-        add_data_to_db(data, str(folder))
+        add_data_to_db(data, folder_str)
 
         # Final success message
         boxed_message("🎉 Initial Setup Complete!")
@@ -541,6 +575,11 @@ def setup_new_project(data, folder):
         boxed_message("Run LaunchKIT again to access development tools! 🚀")
     except Exception as e:
         print(f"ERROR: {e}")
+        # The cleanup removes .git and the scaffold, so the checkpointed steps must rerun
+        data["git_setup"] = False
+        data["stack_scaffolding"] = False
+        data["addons_scaffolding"] = False
+        add_data_to_db(data, folder_str, checkpoint=True)
         cleanup_failed_scaffold(folder)
         exiting_program()
         sys.exit(1)
@@ -773,7 +812,6 @@ def run_tests(data, folder):
             pkg_json_path = folder / "package.json"
             test_script_exists = False
             if pkg_json_path.exists():
-                import json
                 try:
                     with open(pkg_json_path, 'r') as f:
                         if "test" in json.load(f).get("scripts", {}):
@@ -960,9 +998,6 @@ def view_project_summary(folder):
 
 def open_project_folder(folder):
     """Open project folder in file manager."""
-    import subprocess
-    import platform
-
     try:
         system = platform.system()
         if system == "Windows":
@@ -991,7 +1026,7 @@ def reset_project_config(data, folder):
     confirm = Question(f"Are you sure you want to reset '{project_name}' configuration?",
                        ["Yes, Reset", "No, Cancel"]).ask()
 
-    if "Yes" in confirm:
+    if confirm == "Yes, Reset":
         progress_message("Resetting project configuration...")
 
         # Stop any running services first
@@ -1013,7 +1048,6 @@ def reset_project_config(data, folder):
                         file_path.unlink()
                         removed_files.append(file_name)
                     elif file_path.is_dir():
-                        import shutil
                         shutil.rmtree(file_path)
                         removed_files.append(file_name)
             except Exception as e:
@@ -706,8 +706,8 @@ class LaunchKitCLI:
                     self.show_help()
                     continue
                 elif user_input.lower() == 'clear':
-                    import os
-                    os.system('cls' if os.name == 'nt' else 'clear')
+                    from launchkit.utils.platform_utils import TerminalUtils
+                    TerminalUtils.clear_screen()
                     continue
                 elif not user_input:
                     continue
@@ -1,29 +1,32 @@
+import sys
+import time
+
+from rich.console import Console
+from rich.panel import Panel
+
+# One long-lived console shared by every rich helper
+console = Console()
+
+
 def exiting_program():
     print("Exiting Program....")
 
     msg = "Thanks for Visiting!"
     width = len(msg) + 6
 
-    print("\n╔" + "═" * width + "╗")
-    print("║" + msg.center(width) + "║")
-    print("╚" + "═" * width + "╝\n")
+    print(f"\n╔{'═' * width}╗\n║{msg.center(width)}║\n╚{'═' * width}╝\n")
 
 
 def boxed_message(msg: str):
     border = "─" * (len(msg) + 4)
-    print(f"\n┌{border}┐")
-    print(f"│  {msg}  │")
-    print(f"└{border}┘\n")
+    # Build the box as one string so it reaches the terminal in a single write
+    print(f"\n┌{border}┐\n│  {msg}  │\n└{border}┘\n")
 
 
 def arrow_message(step: str):
     print(f"➡️  {step}\n")
 
 
-import sys
-import time
-
-
 def progress_message(msg: str):
     sys.stdout.write(f"{msg}")
     sys.stdout.flush()
@@ -34,12 +37,6 @@ def progress_message(msg: str):
     print(" Done!")
 
 
-from rich.console import Console
-from rich.panel import Panel
-
-console = Console()
-
-
 def rich_message(msg: str, show: bool = True, style="bold green"):
     print()
     prefix = "You chose: " if show else ""
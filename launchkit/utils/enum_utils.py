@@ -1,6 +1,8 @@
-from typing import Callable, List, Dict
+from typing import Callable, Dict, Tuple
 
-from launchkit.utils.scaffold_utils import *
+# Scaffolders are referenced by name and resolved from this module only when a stack
+# is actually scaffolded, so reading STACK_CONFIG doesn't import every template
+SCAFFOLDER_MODULE = "launchkit.utils.scaffold_utils"
 
 # PROJECT_TYPES: List[str] = [
 #     "Frontend only",
@@ -59,13 +61,13 @@ from launchkit.utils.scaffold_utils import *
 #
 # Optional add-ons configurable per project
 
-ADDONS: List[str] = [
+ADDONS: Tuple[str, ...] = (
     "Add Docker Support",
     "Add Kubernetes Support",
     "Add CI (GitHub Actions)",
     "Add Linting & Formatter",
     "Add Unit Testing Skeleton",
-]
+)
 
 # SCAFFOLDERS: Dict[str, Callable[...,bool]] = {
 #     "React (Vite)": scaffold_react_vite,
@@ -107,7 +109,7 @@ STACK_CONFIG = {
     "React (Vite)": {
         "project_type": "Frontend only",
         "language": "js",
-        "scaffolder": scaffold_react_vite,
+        "scaffolder": "scaffold_react_vite",
         "dev_command": "npm run dev",
         "dev_port": 5173,
         "tags": ["react", "vite"],
@@ -115,7 +117,7 @@ STACK_CONFIG = {
     "React (Next.js)": {
         "project_type": "Frontend only",
         "language": "js",
-        "scaffolder": scaffold_nextjs_static,
+        "scaffolder": "scaffold_nextjs_static",
         "dev_command": "npm run dev",
         "dev_port": 3000,
         "tags": ["react", "nextjs"],
@@ -123,35 +125,35 @@ STACK_CONFIG = {
     "Vue.js (Vite)": {
         "project_type": "Frontend only",
         "language": "js",
-        "scaffolder": scaffold_vue_vite,
+        "scaffolder": "scaffold_vue_vite",
         "dev_command": "npm run dev",
         "dev_port": 5173,
     },
     "Nuxt.js (Vue + SSR/SSG)": {
         "project_type": "Frontend only",
         "language": "js",
-        "scaffolder": scaffold_nuxtjs,
+        "scaffolder": "scaffold_nuxtjs",
         "dev_command": "npm run dev",
         "dev_port": 3000,
     },
     "Angular": {
         "project_type": "Frontend only",
         "language": "js",
-        "scaffolder": scaffold_angular,
+        "scaffolder": "scaffold_angular",
         "dev_command": "npm start",
         "dev_port": 4200,
     },
     "Svelte (Vite)": {
         "project_type": "Frontend only",
         "language": "js",
-        "scaffolder": scaffold_svelte_vite,
+        "scaffolder": "scaffold_svelte_vite",
         "dev_command": "npm run dev",
         "dev_port": 5173,
     },
     "SvelteKit": {
         "project_type": "Frontend only",
         "language": "js",
-        "scaffolder": scaffold_sveltekit,
+        "scaffolder": "scaffold_sveltekit",
         "dev_command": "npm run dev",
         "dev_port": 5173,
     },
@@ -160,28 +162,28 @@ STACK_CONFIG = {
     "Node.js (Express)": {
         "project_type": "Backend only",
         "language": "js",
-        "scaffolder": scaffold_node_express,
+        "scaffolder": "scaffold_node_express",
         "dev_command": "npm run dev",
         "dev_port": 5000,
     },
     "Fastify (Node.js)": {
         "project_type": "Backend only",
         "language": "js",
-        "scaffolder": scaffold_fastify,
+        "scaffolder": "scaffold_fastify",
         "dev_command": "npm run dev",
         "dev_port": 5000,
     },
     "NestJS (Node.js - TypeScript)": {
         "project_type": "Backend only",
         "language": "js",
-        "scaffolder": scaffold_nestjs,
+        "scaffolder": "scaffold_nestjs",
         "dev_command": "npm run start:dev",
         "dev_port": 3000,
     },
     "Flask (Python)": {
         "project_type": "Backend only",
         "language": "python",
-        "scaffolder": scaffold_flask_backend,
+        "scaffolder": "scaffold_flask_backend",
         "dev_command": "flask run --debug",
         "dev_port": 5000,
         "env_vars": {"FLASK_ENV": "development", "FLASK_DEBUG": "1"},
@@ -189,35 +191,35 @@ STACK_CONFIG = {
     "Django (Python)": {
         "project_type": "Backend only",
         "language": "python",
-        "scaffolder": scaffold_django,
+        "scaffolder": "scaffold_django",
         "dev_command": "python manage.py runserver",
         "dev_port": 8000,
     },
     "Spring Boot (Java)": {
         "project_type": "Backend only",
         "language": "java",
-        "scaffolder": scaffold_spring_boot,
+        "scaffolder": "scaffold_spring_boot",
         "dev_command": "./mvnw spring-boot:run",
         "dev_port": 8080,
     },
     "Ruby on Rails": {
         "project_type": "Backend only",
         "language": "ruby",
-        "scaffolder": scaffold_ruby_on_rails,
+        "scaffolder": "scaffold_ruby_on_rails",
         "dev_command": "bin/rails server",
         "dev_port": 3000,
     },
     "Go (Gin/Fiber)": {
         "project_type": "Backend only",
         "language": "go",
-        "scaffolder": scaffold_go_gin,
+        "scaffolder": "scaffold_go_gin",
         "dev_command": "go run .",
         "dev_port": 8080,
     },
     "ASP.NET Core (C#)": {
         "project_type": "Backend only",
         "language": "csharp",
-        "scaffolder": scaffold_aspnet_core,
+        "scaffolder": "scaffold_aspnet_core",
         "dev_command": "dotnet run",
         "dev_port": 5164, # Default for .NET 7+
     },
@@ -226,7 +228,7 @@ STACK_CONFIG = {
     "MERN (Mongo + Express + React + Node)": {
         "project_type": "Fullstack",
         "language": "js",
-        "scaffolder": scaffold_mern,
+        "scaffolder": "scaffold_mern",
         "dev_command": "npm run dev",
         "dev_port": 3000, # Frontend port
         "tags": ["react", "express", "mongo"],
@@ -234,7 +236,7 @@ STACK_CONFIG = {
     "PERN (Postgres + Express + React + Node)": {
         "project_type": "Fullstack",
         "language": "js",
-        "scaffolder": scaffold_pern,
+        "scaffolder": "scaffold_pern",
         "dev_command": "npm run dev",
         "dev_port": 3000, # Frontend port
         "tags": ["react", "express", "postgres"],
@@ -242,7 +244,7 @@ STACK_CONFIG = {
     "Flask + React": {
         "project_type": "Fullstack",
         "language": "python-js",
-        "scaffolder": scaffold_flask_react,
+        "scaffolder": "scaffold_flask_react",
         "dev_command": "npm run dev",
         "dev_port": 3000, # Frontend port
         "tags": ["react", "flask"],
@@ -250,7 +252,7 @@ STACK_CONFIG = {
     "OpenAI Demo (API + minimal UI)": {
         "project_type": "Fullstack",
         "language": "python",
-        "scaffolder": scaffold_openai_sdk,
+        "scaffolder": "scaffold_openai_sdk",
         "dev_command": "python app.py",
         "dev_port": None, # No server by default
     },
@@ -259,15 +261,26 @@ STACK_CONFIG = {
     "Empty Project (just Git + README)": {
         "project_type": "Other / Custom",
         "language": "none",
-        "scaffolder": scaffold_empty_project,
+        "scaffolder": "scaffold_empty_project",
         "dev_command": None,
         "dev_port": None,
     },
     "Provide custom instructions at runtime": {
         "project_type": "Other / Custom",
         "language": "none",
-        "scaffolder": scaffold_custom_runtime,
+        "scaffolder": "scaffold_custom_runtime",
         "dev_command": None,
         "dev_port": None,
     },
-}
\ No newline at end of file
+}
+
+
+# Menus derived once from STACK_CONFIG; they are read-only, so tuples
+PROJECT_TYPES: Tuple[str, ...] = tuple(sorted({info["project_type"] for info in STACK_CONFIG.values()}))
+
+STACK_CATALOG: Dict[str, Tuple[str, ...]] = {
+    project_type: tuple(sorted(
+        name for name, info in STACK_CONFIG.items() if info["project_type"] == project_type
+    ))
+    for project_type in PROJECT_TYPES
+}
@@ -11,6 +11,7 @@ class LearnerModeManager:
     def __init__(self):
         self.learner_file_name = "launchkit_learner_mode.tmp"
         self.learner_file_path = self._get_learner_file_path()
+        self._enabled = None
 
     def _get_learner_file_path(self):
         """Get the appropriate path for the learner mode file based on OS"""
@@ -38,13 +39,17 @@ class LearnerModeManager:
 
     def is_learner_mode_enabled(self):
         """Check if learner mode is currently enabled"""
-        return self.learner_file_path.exists()
+        # The flag only changes through this manager, so stat the file once per process
+        if self._enabled is None:
+            self._enabled = self.learner_file_path.exists()
+        return self._enabled
 
     def enable_learner_mode(self):
         """Enable learner mode by creating the temp file"""
         try:
             with open(self.learner_file_path, 'w') as f:
                 f.write("learner_mode_enabled\n")
+            self._enabled = True
             status_message("Learner Mode enabled! 📚")
             return True
         except Exception as e:
@@ -57,6 +62,7 @@ class LearnerModeManager:
             if self.learner_file_path.exists():
                 self.learner_file_path.unlink()
                 status_message("Learner Mode disabled! 🎓")
+            self._enabled = False
             return True
         except Exception as e:
             status_message(f"Failed to disable learner mode: {e}", False)
@@ -127,40 +133,51 @@ class LearnerModeManager:
         return str(self.learner_file_path)
 
 
+_shared_manager = None
+
+
+def _get_manager():
+    """Return the process-wide LearnerModeManager, creating it on first use"""
+    global _shared_manager
+    if _shared_manager is None:
+        _shared_manager = LearnerModeManager()
+    return _shared_manager
+
+
 # Convenience functions for easy importing
 def is_learner_mode_on():
     """Quick check if learner mode is enabled"""
-    manager = LearnerModeManager()
+    manager = _get_manager()
     return manager.is_learner_mode_enabled()
 
 
 def setup_learner_mode(is_first_time=True):
     """Setup learner mode based on user's status"""
-    manager = LearnerModeManager()
+    manager = _get_manager()
     return manager.handle_learner_mode_setup(is_first_time)
 
 
 def manage_learner_mode_settings():
     """Allow users to manually manage learner mode settings"""
-    manager = LearnerModeManager()
+    manager = _get_manager()
     return manager.show_returning_user_learner_prompt()
 
 
 def disable_learner_mode():
     """Disable learner mode"""
-    manager = LearnerModeManager()
+    manager = _get_manager()
     return manager.disable_learner_mode()
 
 
 def enable_learner_mode():
     """Enable learner mode"""
-    manager = LearnerModeManager()
+    manager = _get_manager()
     return manager.enable_learner_mode()
 
 
 def get_learner_status_info():
     """Get information about learner mode status and file location"""
-    manager = LearnerModeManager()
+    manager = _get_manager()
     return {
         'enabled': manager.is_learner_mode_enabled(),
         'file_path': manager.get_learner_file_location()
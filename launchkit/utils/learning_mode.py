@@ -321,8 +321,8 @@ class LearningMode:
     def _manager():
         """Get or create a cached LearnerModeManager instance."""
         if LearningMode._cached_manager is None:
-            from launchkit.utils.learner_utils import LearnerModeManager
-            LearningMode._cached_manager = LearnerModeManager()
+            from launchkit.utils.learner_utils import _get_manager
+            LearningMode._cached_manager = _get_manager()
         return LearningMode._cached_manager
 
     @staticmethod
@@ -381,9 +381,12 @@ class TerminalUtils:
     def clear_screen() -> None:
         """Clear terminal screen (cross-platform)"""
         if PlatformDetector.is_windows():
+            # cls is a cmd.exe builtin, so it still needs a shell
             os.system('cls')
         else:
-            os.system('clear')
+            # ANSI: home cursor, clear screen and scrollback, without spawning `clear`
+            sys.stdout.write("\033[H\033[2J\033[3J")
+            sys.stdout.flush()
 
     @staticmethod
     def supports_unicode() -> bool:
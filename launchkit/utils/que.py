@@ -1,31 +1,46 @@
-from questionary import select, Style
+from questionary import select, checkbox, Choice, Style
 
 from launchkit.utils.display_utils import rich_message
 
+# Shared by every prompt, so the style rules are only parsed once
+QUESTION_STYLE = Style([
+    ('qmark', 'fg:#ff9d00 bold'),
+    ('question', 'bold'),
+    ('answer', 'fg:#ff9d00 bold'),
+    ('pointer', 'fg:#ff9d00 bold'),
+    ('highlighted', 'fg:#ff9d00 bold'),
+    ('selected', 'fg:#cc5454'),
+    ('separator', 'fg:#cc5454'),
+    ('instruction', ''),
+    ('text', ''),
+    ('disabled', 'fg:#858585 italic')
+])
+
 
 class Question:
-    def __init__(self, question, choices):
+    def __init__(self, question, choices, multi=False, default=None):
         self.question = question
         self.choices = choices
+        self.multi = multi
+        # Pre-selected answer: a choice for select, a list of pre-checked choices for multi
+        self.default = default
 
     def ask(self):
-        user_choice = select(
-            self.question, self.choices, style=Style([
-            ('qmark', 'fg:#ff9d00 bold'),
-            ('question', 'bold'),
-            ('answer', 'fg:#ff9d00 bold'),
-            ('pointer', 'fg:#ff9d00 bold'),
-            ('highlighted', 'fg:#ff9d00 bold'),
-            ('selected', 'fg:#cc5454'),
-            ('separator', 'fg:#cc5454'),
-            ('instruction', ''),
-            ('text', ''),
-            ('disabled', 'fg:#858585 italic')
-        ])).ask()
+        if self.multi:
+            choices = self.choices
+            if self.default:
+                choices = [Choice(choice, checked=choice in self.default) for choice in self.choices]
+            user_choice = checkbox(self.question, choices, style=QUESTION_STYLE).ask()
+        else:
+            default = self.default if self.default in self.choices else None
+            user_choice = select(self.question, self.choices, default=default, style=QUESTION_STYLE).ask()
 
         if user_choice is None:
             raise KeyboardInterrupt("User cancelled selection")
 
-        rich_message(user_choice)
+        if self.multi:
+            rich_message(", ".join(user_choice) if user_choice else "Nothing")
+        else:
+            rich_message(user_choice)
 
-        return user_choice
\ No newline at end of file
+        return user_choice
@@ -5,7 +5,7 @@ import tempfile
 import subprocess
 from pathlib import Path
 
-from launchkit.core.templates import *
+from launchkit.core import templates
 from launchkit.utils.display_utils import (
     arrow_message,
     status_message,
@@ -92,13 +92,23 @@ def cleanup_failed_scaffold(folder: Path) -> None:
 def _create_file_safely(file_path: Path, content: str) -> bool:
     """Create a file with error handling."""
     try:
-        file_path.write_text(content, encoding='utf-8')
+        file_path.write_bytes(content.encode("utf-8"))
         return True
     except Exception as e:
         status_message(f"Failed to create file {file_path}: {e}", False)
         return False
 
 
+def _write_template_files(folder: Path, template_name: str) -> bool:
+    """Write every file of a template to its mapped path under folder."""
+    for rel_path, content in templates.iter_files(template_name):
+        file_path = folder / rel_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        if not _create_file_safely(file_path, content):
+            return False
+    return True
+
+
 def _install_testing_deps_node(folder: Path, framework: str = "jest") -> bool:
     """Install Node.js testing dependencies."""
     try:
@@ -579,7 +589,7 @@ def scaffold_node_express(folder: Path) -> bool:
 
         # Create server file
         server_js = folder / "server.js"
-        if not _create_file_safely(server_js, scaffold_node_express_template["server"]):
+        if not _create_file_safely(server_js, templates.get_template("node_express", "server")):
             return False
 
         # === FIX: Read package.json created by 'npm init -y' instead of loading from template ===
@@ -594,9 +604,9 @@ def scaffold_node_express(folder: Path) -> bool:
         package_data.setdefault("scripts", {})
 
         # Try to load scripts from template, but don't fail if template is bad
-        if "package" in scaffold_node_express_template:
+        if "package" in templates.scaffold_node_express_template:
             try:
-                template_data = json.loads(scaffold_node_express_template["package"])
+                template_data = json.loads(templates.get_template("node_express", "package"))
                 if "scripts" in template_data:
                     package_data["scripts"].update(template_data["scripts"])
             except json.JSONDecodeError as e:
@@ -631,7 +641,7 @@ describe('GET /', () => {
 
         # Create .env file
         env_file = folder / ".env"
-        if not _create_file_safely(env_file, scaffold_node_express_template["env"]):
+        if not _create_file_safely(env_file, templates.get_template("node_express", "env")):
             return False
 
         status_message("Node.js Express backend scaffolded successfully.")
@@ -667,16 +677,16 @@ def scaffold_flask_backend(folder: Path) -> bool:
 
         # Create app.py
         app_py = folder / "app.py"
-        if not _create_file_safely(app_py, scaffold_flask_backend_template["app_py"]):
+        if not _create_file_safely(app_py, templates.get_template("flask_backend", "app_py")):
             return False
 
         # Create .env file
         env_file = folder / ".env"
-        if not _create_file_safely(env_file, scaffold_flask_backend_template["env"]):
+        if not _create_file_safely(env_file, templates.get_template("flask_backend", "env")):
             return False
 
         # Create requirements.txt with testing dependencies
-        requirements_content = scaffold_flask_backend_template["requirements"]
+        requirements_content = templates.get_template("flask_backend", "requirements")
         requirements_content += "\npytest==7.4.3\npytest-cov==4.1.0\npytest-flask==1.3.0"
         requirements = folder / "requirements.txt"
         if not _create_file_safely(requirements, requirements_content):
@@ -745,7 +755,7 @@ def scaffold_mern(folder: Path) -> bool:
 
         # Create server.js
         server_js = backend_folder / "server.js"
-        if not _create_file_safely(server_js, scaffold_mern_template["server"]):
+        if not _create_file_safely(server_js, templates.get_template("mern", "server")):
             return False
 
         # === FIX: Read package.json created by 'npm init -y' instead of loading from template ===
@@ -760,9 +770,9 @@ def scaffold_mern(folder: Path) -> bool:
         backend_package_data.setdefault("scripts", {})
 
         # Try to load scripts from template
-        if "backend_package" in scaffold_mern_template:
+        if "backend_package" in templates.scaffold_mern_template:
             try:
-                template_data = json.loads(scaffold_mern_template["backend_package"])
+                template_data = json.loads(templates.get_template("mern", "backend_package"))
                 if "scripts" in template_data:
                     backend_package_data["scripts"].update(template_data["scripts"])
             except json.JSONDecodeError as e:
@@ -798,7 +808,7 @@ describe('API Tests', () => {
 
         # Create backend .env
         backend_env = backend_folder / ".env"
-        if not _create_file_safely(backend_env, scaffold_mern_template["backend_env"]):
+        if not _create_file_safely(backend_env, templates.get_template("mern", "backend_env")):
             return False
 
         # --- Create React frontend (FIXED LOGIC) ---
@@ -883,7 +893,7 @@ test('renders learn react link', () => {
 
         # === FIX: Handle broken root_package template ===
         # Create root package.json with updated scripts
-        root_package_content = scaffold_mern_template.get("root_package", "{}")
+        root_package_content = templates.scaffold_mern_template.get("root_package", "{}")
         try:
             root_package_data = json.loads(root_package_content)
         except json.JSONDecodeError as e:
@@ -942,7 +952,7 @@ def scaffold_pern(folder: Path) -> bool:
 
         # Create server.js for PERN
         server_js = backend_folder / "server.js"
-        if not _create_file_safely(server_js, scaffold_pern_template["server"]):
+        if not _create_file_safely(server_js, templates.get_template("pern", "server")):
             return False
 
         # === FIX: Read package.json created by 'npm init -y' instead of loading from template ===
@@ -957,9 +967,9 @@ def scaffold_pern(folder: Path) -> bool:
         backend_package_data.setdefault("scripts", {})
 
         # Try to load scripts from template
-        if "backend_package" in scaffold_pern_template:
+        if "backend_package" in templates.scaffold_pern_template:
             try:
-                template_data = json.loads(scaffold_pern_template["backend_package"])
+                template_data = json.loads(templates.get_template("pern", "backend_package"))
                 if "scripts" in template_data:
                     backend_package_data["scripts"].update(template_data["scripts"])
             except json.JSONDecodeError as e:
@@ -1000,7 +1010,7 @@ describe('PERN API Tests', () => {
 
         # Create backend .env
         backend_env = backend_folder / ".env"
-        if not _create_file_safely(backend_env, scaffold_pern_template["backend_env"]):
+        if not _create_file_safely(backend_env, templates.get_template("pern", "backend_env")):
             return False
 
         # --- Create React frontend (FIXED LOGIC) ---
@@ -1055,7 +1065,7 @@ export default defineConfig({
 
         # === FIX: Handle broken root_package template ===
         # Create root package.json
-        root_package_content = scaffold_pern_template.get("root_package", "{}")
+        root_package_content = templates.scaffold_pern_template.get("root_package", "{}")
         try:
             root_package_data = json.loads(root_package_content)
         except json.JSONDecodeError as e:
@@ -1141,11 +1151,11 @@ def scaffold_flask_react(folder: Path) -> bool:
 
         # Create Flask app with CORS support
         app_py = backend_folder / "app.py"
-        if not _create_file_safely(app_py, scaffold_flask_react_template["backend_app_py"]):
+        if not _create_file_safely(app_py, templates.get_template("flask_react", "backend_app_py")):
             return False
 
         # Create backend requirements.txt with testing
-        requirements_content = scaffold_flask_react_template["backend_requirements"]
+        requirements_content = templates.get_template("flask_react", "backend_requirements")
         requirements_content += "\npytest==7.4.3\npytest-cov==4.1.0\npytest-flask==1.3.0"
 
         requirements = backend_folder / "requirements.txt"
@@ -1154,7 +1164,7 @@ def scaffold_flask_react(folder: Path) -> bool:
 
         # Create backend .env
         env_file = backend_folder / ".env"
-        if not _create_file_safely(env_file, scaffold_flask_react_template["backend_env"]):
+        if not _create_file_safely(env_file, templates.get_template("flask_react", "backend_env")):
             return False
 
         # Setup backend testing
@@ -1211,7 +1221,7 @@ export default defineConfig({
 
         # Create root package.json for running both servers with test scripts
         # === FIX: Handle broken root_package template ===
-        root_package_content = scaffold_flask_react_template.get("root_package", "{}")
+        root_package_content = templates.scaffold_flask_react_template.get("root_package", "{}")
         try:
             root_package_data = json.loads(root_package_content)
         except json.JSONDecodeError as e:
@@ -1269,11 +1279,11 @@ def scaffold_openai_sdk(folder: Path) -> bool:
 
         # Create example script
         app_py = folder / "app.py"
-        if not _create_file_safely(app_py, scaffold_openai_template["app_py"]):
+        if not _create_file_safely(app_py, templates.get_template("openai", "app_py")):
             return False
 
         # Create requirements.txt with testing
-        requirements_content = scaffold_openai_template["requirements"]
+        requirements_content = templates.get_template("openai", "requirements")
         requirements_content += "\npytest==7.4.3\npytest-cov==4.1.0"
 
         requirements = folder / "requirements.txt"
@@ -1314,12 +1324,12 @@ def test_basic_functionality():
 
         # Create .env file
         env_file = folder / ".env"
-        if not _create_file_safely(env_file, scaffold_openai_template["env"]):
+        if not _create_file_safely(env_file, templates.get_template("openai", "env")):
             return False
 
         # Create README
         readme = folder / "README.md"
-        if not _create_file_safely(readme, scaffold_openai_template["readme"]):
+        if not _create_file_safely(readme, templates.get_template("openai", "readme")):
             return False
 
         status_message("OpenAI SDK project scaffolded successfully.")
@@ -1342,12 +1352,12 @@ def scaffold_empty_project(folder: Path) -> bool:
 
         # Create README
         readme = folder / "README.md"
-        if not _create_file_safely(readme, scaffold_empty_project_template["readme"]):
+        if not _create_file_safely(readme, templates.get_template("empty_project", "readme")):
             return False
 
         # Create .gitignore
         gitignore = folder / ".gitignore"
-        if not _create_file_safely(gitignore, scaffold_empty_project_template["gitignore"]):
+        if not _create_file_safely(gitignore, templates.get_template("empty_project", "gitignore")):
             return False
 
         # Create basic test structure
@@ -1394,7 +1404,8 @@ def scaffold_custom_runtime(folder: Path, project_name: str = None, description:
                 instructions = "\n".join(instructions_lines)
 
         # Create README with custom instructions
-        readme_content = scaffold_custom_runtime_template["readme_template"].format(
+        readme_content = templates.render(
+            "custom_runtime", "readme_template",
             project_name=project_name,
             description=description,
             instructions=instructions
@@ -1406,7 +1417,7 @@ def scaffold_custom_runtime(folder: Path, project_name: str = None, description:
 
         # Create basic .gitignore
         gitignore = folder / ".gitignore"
-        if not _create_file_safely(gitignore, scaffold_empty_project_template["gitignore"]):
+        if not _create_file_safely(gitignore, templates.get_template("empty_project", "gitignore")):
             return False
 
         # Create basic project structure
@@ -1580,8 +1591,7 @@ def scaffold_fastify(folder: Path) -> bool:
         if not run_command_with_output("npm install --save-dev nodemon jest supertest", cwd=folder): return False
         status_message("Fastify dependencies installed.")
 
-        if not _create_file_safely(folder / "server.js", scaffold_fastify_template["server"]): return False
-        if not _create_file_safely(folder / ".env", scaffold_fastify_template["env"]): return False
+        if not _write_template_files(folder, "scaffold_fastify_template"): return False
 
         package_path = folder / "package.json"
 
@@ -1670,9 +1680,7 @@ def scaffold_django(folder: Path) -> bool:
 
         status_message("Django project created.")
 
-        if not _create_file_safely(folder / ".env", scaffold_django_template["env"]):
-            return False
-        if not _create_file_safely(folder / "requirements.txt", scaffold_django_template["requirements"]):
+        if not _write_template_files(folder, "scaffold_django_template"):
             return False
 
         status_message("Django backend scaffolded successfully.")
@@ -1685,22 +1693,12 @@ def scaffold_django(folder: Path) -> bool:
 def scaffold_spring_boot(folder: Path) -> bool:
     arrow_message("Scaffolding Spring Boot (Java) backend...")
     try:
-        # Create directory structure
-        java_dir = folder / "src" / "main" / "java" / "com" / "example" / "demo"
-        resources_dir = folder / "src" / "main" / "resources"
+        # Create the test tree; the source and resource dirs are created with their files
         test_dir = folder / "src" / "test" / "java" / "com" / "example" / "demo"
-        java_dir.mkdir(parents=True, exist_ok=True)
-        resources_dir.mkdir(parents=True, exist_ok=True)
         test_dir.mkdir(parents=True, exist_ok=True)
 
         # Create files
-        if not _create_file_safely(folder / "pom.xml", scaffold_spring_boot_template["pom_xml"]): return False
-        if not _create_file_safely(java_dir / "DemoApplication.java",
-                                   scaffold_spring_boot_template["main_app"]): return False
-        if not _create_file_safely(java_dir / "HelloController.java",
-                                   scaffold_spring_boot_template["controller"]): return False
-        if not _create_file_safely(resources_dir / "application.properties",
-                                   scaffold_spring_boot_template["properties"]): return False
+        if not _write_template_files(folder, "scaffold_spring_boot_template"): return False
 
         status_message("Spring Boot project structure created.")
         arrow_message("Run './mvnw spring-boot:run' to start the server.")
@@ -1730,12 +1728,7 @@ def scaffold_ruby_on_rails(folder: Path) -> bool:
         status_message("Rails API project created.")
 
         # Create additional files in the final location
-        controller_dir = folder / "app" / "controllers" / "api" / "v1"
-        controller_dir.mkdir(parents=True, exist_ok=True)
-        if not _create_file_safely(controller_dir / "greetings_controller.rb",
-                                   scaffold_ruby_on_rails_template["controller"]):
-            return False
-        if not _create_file_safely(folder / "config" / "routes.rb", scaffold_ruby_on_rails_template["routes"]):
+        if not _write_template_files(folder, "scaffold_ruby_on_rails_template"):
             return False
 
         # Create the database
@@ -1753,7 +1746,7 @@ def scaffold_go_gin(folder: Path) -> bool:
     arrow_message("Scaffolding Go (Gin) backend...")
     try:
         if not run_command_with_output(f"go mod init {folder.name}", cwd=folder): return False
-        if not _create_file_safely(folder / "main.go", scaffold_go_gin_template["main_go"]): return False
+        if not _write_template_files(folder, "scaffold_go_gin_template"): return False
         status_message("Go module initialized and main.go created.")
 
         if not run_command_with_output("go get -u github.com/gin-gonic/gin", cwd=folder): return False
@@ -1,5 +1,9 @@
 # launchkit/utils/stack_utils.py
-from launchkit.utils.enum_utils import STACK_CONFIG
+import importlib
+from enum import Flag, auto
+from functools import lru_cache
+
+from launchkit.utils.enum_utils import STACK_CONFIG, SCAFFOLDER_MODULE
 
 
 def _get_stack_property(stack: str, prop: str, default: any = "unknown") -> any:
@@ -7,27 +11,58 @@ def _get_stack_property(stack: str, prop: str, default: any = "unknown") -> any:
     return STACK_CONFIG.get(stack, {}).get(prop, default)
 
 
+def get_stack_scaffolder(stack: str):
+    """Resolve the scaffolder function registered for a stack, importing it on demand."""
+    scaffolder_name = _get_stack_property(stack, "scaffolder", None)
+    if not scaffolder_name:
+        return None
+    return getattr(importlib.import_module(SCAFFOLDER_MODULE), scaffolder_name, None)
+
+
+class StackKind(Flag):
+    """Language families and frameworks a stack uses; fullstack stacks can be several at once."""
+    OTHER = 0
+    NODE_JS = auto()
+    PYTHON = auto()
+    REACT = auto()
+    NEXT_JS = auto()
+
+
+@lru_cache(maxsize=32)
+def classify_stack(stack: str) -> StackKind:
+    """Classify a stack in one pass over its config and name; repeat lookups hit the cache."""
+    language = _get_stack_property(stack, "language", "")
+    kind = StackKind.OTHER
+    if "js" in language:
+        kind |= StackKind.NODE_JS
+    if "python" in language:
+        kind |= StackKind.PYTHON
+    # STACK_CONFIG doesn't specify the framework, so checking the name is simplest.
+    if "React" in stack:
+        kind |= StackKind.REACT
+    if "Next.js" in stack:
+        kind |= StackKind.NEXT_JS
+    return kind
+
+
 def is_node_based_stack(stack: str) -> bool:
     """Check if stack is Node.js/JavaScript based by looking at its language property."""
-    language = _get_stack_property(stack, "language", "")
-    return "js" in language
+    return StackKind.NODE_JS in classify_stack(stack)
 
 
 def is_python_based_stack(stack: str) -> bool:
     """Check if stack is Python based by looking at its language property."""
-    language = _get_stack_property(stack, "language", "")
-    return "python" in language
+    return StackKind.PYTHON in classify_stack(stack)
 
 
 def is_react_based_stack(stack: str) -> bool:
     """Check if stack includes React by looking at its name."""
-    # STACK_CONFIG doesn't specify the framework, so checking the name is simplest.
-    return "React" in stack
+    return StackKind.REACT in classify_stack(stack)
 
 
 def is_next_js_stack(stack: str) -> bool:
     """Check if stack is Next.js based by looking at its name."""
-    return "Next.js" in stack
+    return StackKind.NEXT_JS in classify_stack(stack)
 
 
 def is_fullstack_stack(stack: str) -> bool:
@@ -465,7 +465,7 @@ def reset_project_config(data: Dict[str, Any], folder: Path):
             ["Yes, reset configuration", "No, keep current setup"]
         ).ask()
 
-        if "No" in warning:
+        if warning == "No, keep current setup":
             return data
 
         progress_message("Resetting project configuration...")
@@ -4,11 +4,11 @@ import os
 import shutil
 import subprocess
 import sys
+import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Tuple, Dict, Any, List, Union
 
-import names
 import yaml
 
 from launchkit.utils.display_utils import (
@@ -39,6 +39,9 @@ class CommandResult(tuple):
     def __bool__(self):
         return self.success
 
+# Placeholder names for users who prefer to stay anonymous
+_ANONYMOUS_NAMES = ("Nova", "Orion", "Sage", "Wren", "Echo", "Vega", "Ash", "Rook")
+
 # Possible user choices for identity
 user_identity = ["Yes, Sure", "Keep it Anonymous"]
 
@@ -2987,7 +2990,7 @@ def delete_docker_configuration(project_folder: Path, data: dict):
     confirm_options = ["Yes, Delete Configuration Only", "Yes, Delete All (Config + Stop Containers)", "No, Cancel"]
     confirm = Question("Are you sure you want to delete the Docker configuration?", confirm_options).ask()
 
-    if "No" in confirm:
+    if confirm == confirm_options[-1]:
         arrow_message("Docker configuration deletion cancelled.")
         return data
 
@@ -3136,7 +3139,7 @@ def delete_kubernetes_configuration(project_folder: Path, data: dict):
     confirm_options = ["Yes, Delete Configuration Only", "Yes, Delete All (Config + K8s Resources)", "No, Cancel"]
     confirm = Question("Are you sure you want to delete the Kubernetes configuration?", confirm_options).ask()
 
-    if "No" in confirm:
+    if confirm == confirm_options[-1]:
         arrow_message("Kubernetes configuration deletion cancelled.")
         return data
 
@@ -3853,6 +3856,21 @@ def handle_docker_kubernetes_operations():
                 project_specific_container_management(data)
 
 
+def _ask_user_name() -> str:
+    """Ask whether to use the login name, otherwise pick a friendly anonymous one."""
+    identity_user = Question("Would you mind sharing your name with us?", user_identity).ask()
+
+    if identity_user == user_identity[0]:
+        user_name = getpass.getuser()
+        rich_message(f"Your name is {user_name}", False)
+    else:
+        import random
+        user_name = random.choice(_ANONYMOUS_NAMES)
+        rich_message(f"That's totally fine, we name you {user_name}", False)
+        arrow_message("Hope you like it!")
+    return user_name
+
+
 def create_new_project():
     """Create a new project with user input."""
     base_folder = get_base_launchkit_folder()
@@ -3902,15 +3920,7 @@ def create_new_project():
     boxed_message(f"Created new project folder: {project_folder}")
 
     # Ask for user identity
-    identity_user = Question("Would you mind sharing your name with us?", user_identity).ask()
-    user_name = names.get_first_name()  # default anonymous
-
-    if "Yes" in identity_user:
-        user_name = getpass.getuser()
-        rich_message(f"Your name is {user_name}", False)
-    else:
-        rich_message(f"That's totally fine, we name you {user_name}", False)
-        arrow_message("Hope you like it!")
+    user_name = _ask_user_name()
 
     # Ask about learning mode
     arrow_message("\n📚 Learning Mode helps you understand commands before executing them!")
@@ -3919,7 +3929,7 @@ def create_new_project():
         ["Yes, enable Learning Mode", "No, skip Learning Mode"]
     ).ask()
 
-    learning_mode_enabled = "Yes" in learning_choice
+    learning_mode_enabled = learning_choice == "Yes, enable Learning Mode"
 
     if learning_mode_enabled:
         LearningMode.enable()
@@ -3947,8 +3957,7 @@ def create_new_project():
 
     # Save data.json in project folder
     data_file = project_folder / "data.json"
-    with open(data_file, "w") as f:
-        json.dump(data, f, indent=4)
+    _write_data_file(data_file, json.dumps(data, indent=4))
 
     boxed_message("Project data.json created to keep your project information safe")
     arrow_message("Please make sure not to delete it")
@@ -3959,20 +3968,39 @@ def create_new_project():
     return data
 
 
+# Raw data.json text per path, keyed on (mtime, size) so re-opening the same project in
+# one session skips the file read; add_data_to_db refreshes the entry after each write
+_project_data_cache: Dict[str, Tuple[int, int, str]] = {}
+
+
+def _read_project_data(data_file: Path) -> dict:
+    """Parse data_file's JSON, reading the file again only when it changed."""
+    st = data_file.stat()
+    key = str(data_file)
+    cached = _project_data_cache.get(key)
+    if cached is None or cached[0] != st.st_mtime_ns or cached[1] != st.st_size:
+        cached = (st.st_mtime_ns, st.st_size, data_file.read_text())
+        _project_data_cache[key] = cached
+    # Parsing per call hands every caller its own dict, and is cheaper than a deepcopy
+    return json.loads(cached[2])
+
+
 def load_existing_project(project_name):
     """Load an existing project's data."""
     base_folder = get_base_launchkit_folder()
     project_folder = base_folder / project_name
     data_file = project_folder / "data.json"
 
-    if not data_file.exists():
+    try:
+        data = _read_project_data(data_file)
+    except FileNotFoundError:
         status_message(f"data.json not found for project '{project_name}'", False)
         return None
+    except Exception as e:
+        status_message(f"Failed to load project data: {e}", False)
+        return None
 
     try:
-        with open(data_file, "r") as f:
-            data = json.load(f)
-
         # Update selected_folder to current project folder path
         data["selected_folder"] = str(project_folder)
 
@@ -4075,14 +4103,63 @@ def welcome_user():
             # sys.exit(0)
             return None
 
-def add_data_to_db(data: dict, selected_folder: str):
-    """Update the project's data.json with new data and create a backup."""
+# Last content written to each data.json together with the file's mtime, so saving
+# unchanged data doesn't rewrite the file and pile up identical backups
+_last_saved_data: Dict[str, Tuple[str, int]] = {}
+
+
+def _write_data_file(data_file: Path, text: str):
+    """Replace data_file with text atomically, so an interrupt never leaves it truncated."""
+    with tempfile.NamedTemporaryFile("w", dir=data_file.parent, prefix=".data.json.",
+                                     suffix=".tmp", delete=False) as f:
+        tmp_path = f.name
+        try:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+            # Temp files are created 0600; keep data.json's usual permissions
+            try:
+                mode = data_file.stat().st_mode & 0o777
+            except FileNotFoundError:
+                mode = 0o644
+            os.chmod(tmp_path, mode)
+        except BaseException:
+            f.close()
+            os.unlink(tmp_path)
+            raise
+    try:
+        os.replace(tmp_path, data_file)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def add_data_to_db(data: dict, selected_folder: str, checkpoint: bool = False):
+    """Update the project's data.json with new data and create a backup.
+
+    With checkpoint=True only data.json is written, without the status line or a
+    backup, so multi-step flows can persist progress after every step cheaply.
+    """
     try:
         project_folder = Path(selected_folder)
         data_file = project_folder / "data.json"
+        serialized = json.dumps(data, indent=4)
+
+        cached = _last_saved_data.get(str(data_file))
+        if cached and cached[0] == serialized:
+            try:
+                if data_file.stat().st_mtime_ns == cached[1]:
+                    return True
+            except FileNotFoundError:
+                pass
 
-        with open(data_file, "w") as f:
-            json.dump(data, f, indent=4)
+        _write_data_file(data_file, serialized)
+        st = data_file.stat()
+        _last_saved_data[str(data_file)] = (serialized, st.st_mtime_ns)
+        _project_data_cache[str(data_file)] = (st.st_mtime_ns, st.st_size, serialized)
+
+        if checkpoint:
+            return True
 
         arrow_message("Project data updated successfully")
 
@@ -4107,9 +4184,16 @@ def add_selected_folder_in_data(data):
 
 def ensure_folder_exists(path: Path):
     """Ensure the project folder exists, create if missing."""
-    if not path.exists():
-        status_message(f"Folder {path} doesn't exist. Creating it...", False)
-        path.mkdir(parents=True, exist_ok=True)
+    # Try the mkdir directly; an existing folder costs one syscall instead of stat + mkdir.
+    # No per-session memo: a folder renamed or deleted meanwhile must be recreated.
+    try:
+        path.mkdir(parents=True, exist_ok=False)
+        status_message(f"Folder {path} didn't exist. Created it.", False)
+    except FileExistsError:
+        pass
+
+
+_REQUIRED_PROJECT_KEYS = ("user_name", "selected_folder")
 
 
 def handle_user_data() -> tuple[None, None] | tuple[dict[str | Any, str | bool | None | list[Any] | Any] | Any, Path]:
@@ -4122,6 +4206,18 @@ def handle_user_data() -> tuple[None, None] | tuple[dict[str | Any, str | bool |
             # sys.exit(1)
             return None, None
 
+        # Check the required keys in one pass: a missing folder can't be recovered,
+        # but a missing user name is asked for once and saved silently
+        missing = [key for key in _REQUIRED_PROJECT_KEYS if data.get(key) is None]
+        if "selected_folder" in missing:
+            status_message("Corrupt project data detected. Missing key: selected_folder", False)
+            exiting_program()
+            sys.exit(1)
+        if missing:
+            arrow_message("Project data has no user name saved.")
+            data["user_name"] = _ask_user_name()
+            add_data_to_db(data, data["selected_folder"], checkpoint=True)
+
         user_name = data["user_name"]
         project_name = data.get("project_name", "Unknown Project")
         folder = Path(data["selected_folder"])
@@ -4134,10 +4230,6 @@ def handle_user_data() -> tuple[None, None] | tuple[dict[str | Any, str | bool |
 
         return data, folder
 
-    except KeyError as e:
-        status_message(f"Corrupt project data detected. Missing key: {e.args[0]}", False)
-        exiting_program()
-        sys.exit(1)
     except Exception as e:
         status_message(f"Unexpected error while loading project data: {e}", False)
         exiting_program()
@@ -48,7 +48,6 @@ def test_dependencies():
 
     required_packages = {
         "questionary": "Interactive CLI prompts",
-        "names": "Random name generation",
         "pygithub": "GitHub API integration",
         "docker": "Docker integration",
         "jinja2": "Template rendering",